@@ -0,0 +1,45 @@
+"""
+Migration: Add job_logs table for append-only job log storage.
+
+Up: Creates job_logs table and copies existing entries out of jobs.logs
+Down: Copies entries back into jobs.logs and drops job_logs
+"""
+
+
+def up(conn):
+    """Apply migration."""
+    conn.executescript("""
+        -- Job logs: one row per log entry, appended as jobs run
+        CREATE TABLE IF NOT EXISTS job_logs (
+            job_id TEXT NOT NULL,
+            seq INTEGER NOT NULL,               -- position within the job's log
+            timestamp TEXT NOT NULL,
+            level TEXT NOT NULL DEFAULT 'info', -- info, warning, error, success
+            message TEXT NOT NULL,
+            PRIMARY KEY (job_id, seq),
+            FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE
+        ) WITHOUT ROWID;
+
+        INSERT INTO job_logs (job_id, seq, timestamp, level, message)
+        SELECT j.id, CAST(e.key AS INTEGER),
+               json_extract(e.value, '$.timestamp'),
+               COALESCE(json_extract(e.value, '$.level'), 'info'),
+               json_extract(e.value, '$.message')
+        FROM jobs j, json_each(COALESCE(j.logs, '[]')) e;
+
+        UPDATE jobs SET logs = '[]';
+    """)
+
+
+def down(conn):
+    """Rollback migration."""
+    conn.executescript("""
+        UPDATE jobs SET logs = (
+            SELECT COALESCE(json_group_array(json_object(
+                'timestamp', l.timestamp, 'level', l.level, 'message', l.message
+            )), '[]')
+            FROM (SELECT * FROM job_logs WHERE job_id = jobs.id ORDER BY seq) l
+        );
+
+        DROP TABLE IF EXISTS job_logs;
+    """)
@@ -0,0 +1,20 @@
+"""
+Migration: Index discoveries by tool for the tool detail endpoint.
+
+Up: Creates idx_discoveries_tool on discoveries(tool_id, created_at)
+Down: Drops the index
+"""
+
+
+def up(conn):
+    """Apply migration."""
+    conn.executescript("""
+        CREATE INDEX IF NOT EXISTS idx_discoveries_tool ON discoveries(tool_id, created_at);
+    """)
+
+
+def down(conn):
+    """Rollback migration."""
+    conn.executescript("""
+        DROP INDEX IF EXISTS idx_discoveries_tool;
+    """)
@@ -0,0 +1,33 @@
+"""
+Migration: Composite indexes for filtering and sorting the tools list.
+
+Up: Replaces idx_tools_status and idx_tools_category with
+    (column, relevance_score DESC, created_at DESC) indexes, adds
+    idx_tools_created_at and refreshes planner statistics
+Down: Restores the single-column indexes
+"""
+
+
+def up(conn):
+    """Apply migration."""
+    conn.executescript("""
+        CREATE INDEX IF NOT EXISTS idx_tools_status_score
+            ON tools(status, relevance_score DESC, created_at DESC);
+        CREATE INDEX IF NOT EXISTS idx_tools_category_score
+            ON tools(category, relevance_score DESC, created_at DESC);
+        CREATE INDEX IF NOT EXISTS idx_tools_created_at ON tools(created_at);
+        DROP INDEX IF EXISTS idx_tools_status;
+        DROP INDEX IF EXISTS idx_tools_category;
+        ANALYZE;
+    """)
+
+
+def down(conn):
+    """Rollback migration."""
+    conn.executescript("""
+        CREATE INDEX IF NOT EXISTS idx_tools_status ON tools(status);
+        CREATE INDEX IF NOT EXISTS idx_tools_category ON tools(category);
+        DROP INDEX IF EXISTS idx_tools_created_at;
+        DROP INDEX IF EXISTS idx_tools_category_score;
+        DROP INDEX IF EXISTS idx_tools_status_score;
+    """)
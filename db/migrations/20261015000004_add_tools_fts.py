@@ -0,0 +1,43 @@
+"""
+Migration: Full-text search index for tool names and descriptions.
+
+Up: Creates the tools_fts external-content FTS5 table, the triggers that
+    keep it in sync with tools, and indexes existing rows
+Down: Drops the triggers and the FTS table
+"""
+
+
+def up(conn):
+    """Apply migration."""
+    conn.executescript("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS tools_fts USING fts5(
+            name, description, content='tools', content_rowid='id', tokenize='porter unicode61'
+        );
+
+        CREATE TRIGGER IF NOT EXISTS tools_fts_insert AFTER INSERT ON tools BEGIN
+            INSERT INTO tools_fts (rowid, name, description) VALUES (new.id, new.name, new.description);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS tools_fts_delete AFTER DELETE ON tools BEGIN
+            INSERT INTO tools_fts (tools_fts, rowid, name, description)
+            VALUES ('delete', old.id, old.name, old.description);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS tools_fts_update AFTER UPDATE OF name, description ON tools BEGIN
+            INSERT INTO tools_fts (tools_fts, rowid, name, description)
+            VALUES ('delete', old.id, old.name, old.description);
+            INSERT INTO tools_fts (rowid, name, description) VALUES (new.id, new.name, new.description);
+        END;
+
+        INSERT INTO tools_fts (tools_fts) VALUES ('rebuild');
+    """)
+
+
+def down(conn):
+    """Rollback migration."""
+    conn.executescript("""
+        DROP TRIGGER IF EXISTS tools_fts_update;
+        DROP TRIGGER IF EXISTS tools_fts_delete;
+        DROP TRIGGER IF EXISTS tools_fts_insert;
+        DROP TABLE IF EXISTS tools_fts;
+    """)
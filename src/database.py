@@ -104,12 +104,34 @@ CREATE TABLE IF NOT EXISTS users (
     last_login TIMESTAMP
 );
 
+-- Full-text index over tool names and descriptions, kept in sync by triggers
+CREATE VIRTUAL TABLE IF NOT EXISTS tools_fts USING fts5(
+    name, description, content='tools', content_rowid='id', tokenize='porter unicode61'
+);
+
+CREATE TRIGGER IF NOT EXISTS tools_fts_insert AFTER INSERT ON tools BEGIN
+    INSERT INTO tools_fts (rowid, name, description) VALUES (new.id, new.name, new.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS tools_fts_delete AFTER DELETE ON tools BEGIN
+    INSERT INTO tools_fts (tools_fts, rowid, name, description)
+    VALUES ('delete', old.id, old.name, old.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS tools_fts_update AFTER UPDATE OF name, description ON tools BEGIN
+    INSERT INTO tools_fts (tools_fts, rowid, name, description)
+    VALUES ('delete', old.id, old.name, old.description);
+    INSERT INTO tools_fts (rowid, name, description) VALUES (new.id, new.name, new.description);
+END;
+
 -- Indexes for common queries
-CREATE INDEX IF NOT EXISTS idx_tools_status ON tools(status);
-CREATE INDEX IF NOT EXISTS idx_tools_category ON tools(category);
+CREATE INDEX IF NOT EXISTS idx_tools_status_score ON tools(status, relevance_score DESC, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_tools_category_score ON tools(category, relevance_score DESC, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_tools_created_at ON tools(created_at);
 CREATE INDEX IF NOT EXISTS idx_claims_tool ON claims(tool_id);
 CREATE INDEX IF NOT EXISTS idx_claims_type ON claims(claim_type);
 CREATE INDEX IF NOT EXISTS idx_discoveries_processed ON discoveries(processed);
+CREATE INDEX IF NOT EXISTS idx_discoveries_tool ON discoveries(tool_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_changelog_tool ON changelog(tool_id);
 CREATE INDEX IF NOT EXISTS idx_snapshots_tool ON tool_snapshots(tool_id);
 CREATE INDEX IF NOT EXISTS idx_users_username ON users(username);
@@ -135,6 +157,16 @@ class Database:
             )
             self.conn.row_factory = sqlite3.Row
             self.conn.execute("PRAGMA foreign_keys = ON")
+            # WAL lets readers run alongside the job workers' writes; NORMAL
+            # sync is still crash-safe in WAL mode and skips most fsyncs
+            self.conn.execute("PRAGMA journal_mode = WAL")
+            self.conn.execute("PRAGMA synchronous = NORMAL")
+            # Larger page cache (64 MB cap, grown on demand) and in-memory
+            # temp b-trees for the ORDER BY sorts behind list pages
+            self.conn.execute("PRAGMA cache_size = -64000")
+            self.conn.execute("PRAGMA temp_store = MEMORY")
+            # Read pages through a 256 MB memory map instead of read() calls
+            self.conn.execute("PRAGMA mmap_size = 268435456")
         return self.conn
 
     def close(self):
@@ -206,26 +238,68 @@ class Database:
     def update_tool_status(self, tool_id: int, status: str,
                            rejection_reason: Optional[str] = None) -> None:
         """Update a tool's pipeline status."""
-        conn = self.connect()
-        if status == "rejected" and rejection_reason:
-            conn.execute(
-                """UPDATE tools SET status = ?, rejection_reason = ?,
-                   reviewed_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
-                   WHERE id = ?""",
-                (status, rejection_reason, tool_id)
-            )
-        elif status in ("approved", "rejected"):
-            conn.execute(
-                """UPDATE tools SET status = ?, reviewed_at = CURRENT_TIMESTAMP,
-                   updated_at = CURRENT_TIMESTAMP WHERE id = ?""",
-                (status, tool_id)
-            )
-        else:
-            conn.execute(
-                "UPDATE tools SET status = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
-                (status, tool_id)
-            )
-        conn.commit()
+        self.update_tools_status([tool_id], status, rejection_reason)
+
+    def update_tools_status(self, tool_ids: list[int], status: str,
+                            rejection_reason: Optional[str] = None,
+                            changelog: Optional[str] = None) -> dict[int, str]:
+        """Update the pipeline status of several tools in one statement.
+
+        If ``changelog`` is given, a "new" changelog entry with that
+        description (formatted with the tool's ``name``) is added for each
+        updated tool in the same transaction.
+
+        Returns the names of the tools that were updated, by ID.
+        """
+        if not tool_ids:
+            return {}
+        conn = self.connect()
+        placeholders = ",".join("?" * len(tool_ids))
+        # Commits the statements together, or rolls all of them back on error
+        with conn:
+            if status == "rejected" and rejection_reason:
+                rows = conn.execute(
+                    f"""UPDATE tools SET status = ?, rejection_reason = ?,
+                       reviewed_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
+                       WHERE id IN ({placeholders}) RETURNING id, name""",
+                    (status, rejection_reason, *tool_ids)
+                ).fetchall()
+            elif status in ("approved", "rejected"):
+                rows = conn.execute(
+                    f"""UPDATE tools SET status = ?, reviewed_at = CURRENT_TIMESTAMP,
+                       updated_at = CURRENT_TIMESTAMP WHERE id IN ({placeholders})
+                       RETURNING id, name""",
+                    (status, *tool_ids)
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    f"""UPDATE tools SET status = ?, updated_at = CURRENT_TIMESTAMP
+                       WHERE id IN ({placeholders}) RETURNING id, name""",
+                    (status, *tool_ids)
+                ).fetchall()
+            names = {row["id"]: row["name"] for row in rows}
+            if changelog and names:
+                conn.executemany(
+                    "INSERT INTO changelog (tool_id, change_type, description) VALUES (?, 'new', ?)",
+                    [(tool_id, changelog.format(name=name)) for tool_id, name in names.items()]
+                )
+        return names
+
+    def delete_tools(self, tool_ids: list[int]) -> set[int]:
+        """Delete several tools and their claims.
+
+        Returns the IDs of the tools that existed and were deleted.
+        """
+        if not tool_ids:
+            return set()
+        conn = self.connect()
+        placeholders = ",".join("?" * len(tool_ids))
+        with conn:
+            conn.execute(f"DELETE FROM claims WHERE tool_id IN ({placeholders})", tool_ids)
+            rows = conn.execute(
+                f"DELETE FROM tools WHERE id IN ({placeholders}) RETURNING id", tool_ids
+            ).fetchall()
+        return {row[0] for row in rows}
 
     def set_relevance_score(self, tool_id: int, score: float):
         """Set a tool's relevance score."""
@@ -353,6 +427,15 @@ class Database:
         conn.commit()
         return entry_id
 
+    def add_changelog_entries(self, entries: list[tuple[int, str, str]]) -> None:
+        """Add several (tool_id, change_type, description) changelog entries."""
+        conn = self.connect()
+        conn.executemany(
+            "INSERT INTO changelog (tool_id, change_type, description) VALUES (?, ?, ?)",
+            entries
+        )
+        conn.commit()
+
     def get_recent_changes(self, days: int = 7, limit: int = 100) -> list[dict]:
         """Get recent changelog entries."""
         conn = self.connect()
@@ -475,6 +558,24 @@ class Database:
         )
         conn.commit()
 
+    def set_settings_bulk(self, user_id: int,
+                          settings: list[tuple[str, str, str, bool]]) -> None:
+        """Set several (category, key, value, is_secret) settings in one transaction."""
+        conn = self.connect()
+        conn.executemany(
+            """INSERT INTO settings (user_id, category, key, value, is_secret)
+               VALUES (?, ?, ?, ?, ?)
+               ON CONFLICT(user_id, category, key) DO UPDATE SET
+                   value = excluded.value,
+                   is_secret = excluded.is_secret,
+                   updated_at = CURRENT_TIMESTAMP""",
+            [
+                (user_id, category, key, value, 1 if is_secret else 0)
+                for category, key, value, is_secret in settings
+            ]
+        )
+        conn.commit()
+
     def delete_setting(self, user_id: int, category: str, key: str) -> bool:
         """Delete a setting. Returns True if deleted."""
         conn = self.connect()
@@ -522,17 +623,24 @@ class Database:
                 job['result'] = json.loads(job['result'])
             if job.get('config'):
                 job['config'] = json.loads(job['config'])
-            if job.get('logs'):
-                job['logs'] = json.loads(job['logs'])
-            else:
-                job['logs'] = []
+            job['logs'] = self.get_job_logs(job_id)
             return job
         return None
 
+    def get_job_logs(self, job_id: str) -> list[dict]:
+        """Get a job's log entries in the order they were written."""
+        conn = self.connect()
+        rows = conn.execute(
+            """SELECT timestamp, level, message FROM job_logs
+               WHERE job_id = ? ORDER BY seq""",
+            (job_id,)
+        ).fetchall()
+        return [dict(row) for row in rows]
+
     def update_job(self, job_id: str, status: Optional[str] = None,
                    progress: Optional[int] = None, message: Optional[str] = None,
                    result: Optional[dict] = None, error: Optional[str] = None,
-                   logs: Optional[list] = None, completed: bool = False) -> None:
+                   completed: bool = False) -> None:
         """Update job status and fields."""
         conn = self.connect()
         updates = []
@@ -558,10 +666,6 @@ class Database:
             updates.append("error = ?")
             params.append(error)
 
-        if logs is not None:
-            updates.append("logs = ?")
-            params.append(json.dumps(logs))
-
         if completed:
             updates.append("completed_at = CURRENT_TIMESTAMP")
 
@@ -571,30 +675,54 @@ class Database:
             conn.execute(query, params)
             conn.commit()
 
+    def update_jobs_batch(self, jobs: list[dict]) -> None:
+        """Update several jobs in a single transaction.
+
+        Each dict holds the job 'id' and its current 'status', 'progress',
+        'message', 'result' and 'error', a 'completed' flag, and 'logs' -
+        new log entries to append after the job's existing entries.
+        """
+        if not jobs:
+            return
+        conn = self.connect()
+        with conn:
+            conn.executemany(
+                """UPDATE jobs SET status = ?, progress = ?, message = ?,
+                   result = ?, error = ?,
+                   completed_at = CASE WHEN ? THEN CURRENT_TIMESTAMP ELSE completed_at END
+                   WHERE id = ?""",
+                [
+                    (
+                        job['status'], job['progress'], job['message'],
+                        json.dumps(job['result']) if job['result'] is not None else None,
+                        job['error'], job['completed'], job['id'],
+                    )
+                    for job in jobs
+                ]
+            )
+            conn.executemany(
+                """INSERT INTO job_logs (job_id, seq, timestamp, level, message)
+                   SELECT ?, COALESCE(MAX(seq), -1) + 1, ?, ?, ?
+                   FROM job_logs WHERE job_id = ?""",
+                [
+                    (job['id'], log['timestamp'], log['level'], log['message'], job['id'])
+                    for job in jobs for log in job['logs']
+                ]
+            )
+
     def add_job_log(self, job_id: str, message: str,
                     level: str = 'info') -> None:
         """Add a log entry to a job."""
         from datetime import datetime
         conn = self.connect()
-
-        # Get current logs
-        row = conn.execute(
-            "SELECT logs FROM jobs WHERE id = ?", (job_id,)
-        ).fetchone()
-
-        if row:
-            logs = json.loads(row['logs'] or '[]')
-            logs.append({
-                'timestamp': datetime.now().isoformat(),
-                'level': level,
-                'message': message,
-            })
-
-            conn.execute(
-                "UPDATE jobs SET logs = ? WHERE id = ?",
-                (json.dumps(logs), job_id)
-            )
-            conn.commit()
+        conn.execute(
+            """INSERT INTO job_logs (job_id, seq, timestamp, level, message)
+               SELECT id, (SELECT COALESCE(MAX(seq), -1) + 1 FROM job_logs WHERE job_id = ?),
+                      ?, ?, ?
+               FROM jobs WHERE id = ?""",
+            (job_id, datetime.now().isoformat(), level, message, job_id)
+        )
+        conn.commit()
 
     def list_jobs(self, limit: int = 20, status: Optional[str] = None,
                   user_id: Optional[int] = None) -> list[dict]:
@@ -611,7 +739,8 @@ class Database:
             query += " AND user_id = ?"
             params.append(user_id)
 
-        query += " ORDER BY started_at DESC LIMIT ?"
+        # id breaks ties between jobs started in the same second
+        query += " ORDER BY started_at DESC, id DESC LIMIT ?"
         params.append(limit)
 
         rows = conn.execute(query, params).fetchall()
@@ -622,13 +751,42 @@ class Database:
                 job['result'] = json.loads(job['result'])
             if job.get('config'):
                 job['config'] = json.loads(job['config'])
-            if job.get('logs'):
-                job['logs'] = json.loads(job['logs'])
-            else:
-                job['logs'] = []
+            job['logs'] = []
             jobs.append(job)
+
+        # Fetch logs for all listed jobs in one query
+        if jobs:
+            by_id = {job['id']: job for job in jobs}
+            placeholders = ",".join("?" * len(by_id))
+            log_rows = conn.execute(
+                f"""SELECT job_id, timestamp, level, message FROM job_logs
+                    WHERE job_id IN ({placeholders}) ORDER BY job_id, seq""",
+                list(by_id)
+            ).fetchall()
+            for log in log_rows:
+                by_id[log['job_id']]['logs'].append({
+                    'timestamp': log['timestamp'],
+                    'level': log['level'],
+                    'message': log['message'],
+                })
         return jobs
 
+    def fail_interrupted_jobs(self) -> int:
+        """Mark jobs left pending or running by a previous process as failed.
+
+        Returns count of jobs updated.
+        """
+        conn = self.connect()
+        cursor = conn.execute(
+            """UPDATE jobs SET status = 'failed',
+               error = 'Interrupted by server restart',
+               message = 'Failed: interrupted by server restart',
+               completed_at = CURRENT_TIMESTAMP
+               WHERE status IN ('pending', 'running')"""
+        )
+        conn.commit()
+        return cursor.rowcount
+
     def delete_old_jobs(self, days: int = 7) -> int:
         """Delete jobs older than specified days. Returns count deleted."""
         conn = self.connect()
@@ -9,6 +9,9 @@ from src.reporters.reports import (
     generate_changelog,
     generate_tools_index,
     generate_weekly_digest,
+    iter_changelog,
+    iter_tools_index,
+    iter_weekly_digest,
     save_report,
 )
 
@@ -16,6 +19,9 @@ __all__ = [
     'generate_weekly_digest',
     'generate_changelog',
     'generate_tools_index',
+    'iter_weekly_digest',
+    'iter_changelog',
+    'iter_tools_index',
     'save_report',
     'ReportStats',
 ]
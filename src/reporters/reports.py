@@ -7,7 +7,7 @@ Generate digests, changelogs, and summaries.
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 from src.database import Database
 
@@ -22,15 +22,15 @@ class ReportStats:
     total_claims: int
 
 
-def generate_weekly_digest(db: Database, weeks_back: int = 1) -> str:
-    """Generate a weekly digest in Markdown format.
+def iter_weekly_digest(db: Database, weeks_back: int = 1) -> Iterator[str]:
+    """Yield the weekly digest line by line.
 
     Args:
         db: Database connection
         weeks_back: How many weeks back to report (1 = last week)
 
-    Returns:
-        Markdown formatted report string
+    Yields:
+        Markdown lines, without trailing newlines
     """
     conn = db.connect()
 
@@ -70,60 +70,59 @@ def generate_weekly_digest(db: Database, weeks_back: int = 1) -> str:
     ).fetchone()[0]
 
     # Build report
-    lines = []
-    lines.append("# Glean Weekly Digest")
-    lines.append("")
-    lines.append(f"**Period:** {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
-    lines.append(f"**Generated:** {end_date.strftime('%Y-%m-%d %H:%M')}")
-    lines.append("")
+    yield "# Glean Weekly Digest"
+    yield ""
+    yield f"**Period:** {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
+    yield f"**Generated:** {end_date.strftime('%Y-%m-%d %H:%M')}"
+    yield ""
 
     # Summary stats
-    lines.append("## Summary")
-    lines.append("")
-    lines.append(f"- **New tools approved:** {len(new_tools)}")
-    lines.append(f"- **Updates detected:** {len(changes)}")
-    lines.append(f"- **Total approved tools:** {total_approved}")
-    lines.append(f"- **Tools pending review:** {total_in_review}")
-    lines.append("")
+    yield "## Summary"
+    yield ""
+    yield f"- **New tools approved:** {len(new_tools)}"
+    yield f"- **Updates detected:** {len(changes)}"
+    yield f"- **Total approved tools:** {total_approved}"
+    yield f"- **Tools pending review:** {total_in_review}"
+    yield ""
 
     # New tools section
     if new_tools:
-        lines.append("## New Tools")
-        lines.append("")
+        yield "## New Tools"
+        yield ""
         for tool in new_tools:
             tool = dict(tool)
             score = tool.get('relevance_score')
             score_str = f" (relevance: {score:.0%})" if score else ""
 
-            lines.append(f"### {tool['name']}{score_str}")
-            lines.append("")
+            yield f"### {tool['name']}{score_str}"
+            yield ""
             if tool.get('url'):
-                lines.append(f"**URL:** {tool['url']}")
+                yield f"**URL:** {tool['url']}"
             if tool.get('category'):
-                lines.append(f"**Category:** {tool['category']}")
+                yield f"**Category:** {tool['category']}"
             if tool.get('description'):
-                lines.append("")
-                lines.append(f"{tool['description']}")
+                yield ""
+                yield f"{tool['description']}"
 
             # Get claims for this tool
             claims = db.get_claims_for_tool(tool['id'])
             if claims:
-                lines.append("")
-                lines.append("**Key claims:**")
+                yield ""
+                yield "**Key claims:**"
                 for claim in claims[:3]:
-                    lines.append(f"- {claim['content'][:100]}")
+                    yield f"- {claim['content'][:100]}"
 
-            lines.append("")
+            yield ""
     else:
-        lines.append("## New Tools")
-        lines.append("")
-        lines.append("*No new tools approved this period.*")
-        lines.append("")
+        yield "## New Tools"
+        yield ""
+        yield "*No new tools approved this period.*"
+        yield ""
 
     # Updates section
     if changes:
-        lines.append("## Updates & Changes")
-        lines.append("")
+        yield "## Updates & Changes"
+        yield ""
 
         # Group by tool
         changes_by_tool: dict[str, list[dict]] = {}
@@ -135,35 +134,46 @@ def generate_weekly_digest(db: Database, weeks_back: int = 1) -> str:
             changes_by_tool[tool_name].append(change)
 
         for tool_name, tool_changes in changes_by_tool.items():
-            lines.append(f"### {tool_name}")
-            lines.append("")
+            yield f"### {tool_name}"
+            yield ""
             for change in tool_changes:
                 date = change['detected_at'][:10]
-                lines.append(f"- **{change['change_type']}** ({date}): {change['description']}")
-            lines.append("")
+                yield f"- **{change['change_type']}** ({date}): {change['description']}"
+            yield ""
     else:
-        lines.append("## Updates & Changes")
-        lines.append("")
-        lines.append("*No updates detected this period.*")
-        lines.append("")
+        yield "## Updates & Changes"
+        yield ""
+        yield "*No updates detected this period.*"
+        yield ""
 
     # Footer
-    lines.append("---")
-    lines.append("*Generated by Glean*")
+    yield "---"
+    yield "*Generated by Glean*"
 
-    return '\n'.join(lines)
 
+def generate_weekly_digest(db: Database, weeks_back: int = 1) -> str:
+    """Generate a weekly digest in Markdown format.
 
-def generate_changelog(db: Database, days: int = 7, tool_id: Optional[int] = None) -> str:
-    """Generate a changelog in Markdown format.
+    Args:
+        db: Database connection
+        weeks_back: How many weeks back to report (1 = last week)
+
+    Returns:
+        Markdown formatted report string
+    """
+    return '\n'.join(iter_weekly_digest(db, weeks_back))
+
+
+def iter_changelog(db: Database, days: int = 7, tool_id: Optional[int] = None) -> Iterator[str]:
+    """Yield the changelog line by line.
 
     Args:
         db: Database connection
         days: Number of days to include
         tool_id: Optional specific tool ID to filter by
 
-    Returns:
-        Markdown formatted changelog string
+    Yields:
+        Markdown lines, without trailing newlines
     """
     conn = db.connect()
 
@@ -193,12 +203,11 @@ def generate_changelog(db: Database, days: int = 7, tool_id: Optional[int] = Non
         title = "Changelog: All Tools"
 
     # Build report
-    lines = []
-    lines.append(f"# {title}")
-    lines.append("")
-    lines.append(f"**Period:** Last {days} days")
-    lines.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-    lines.append("")
+    yield f"# {title}"
+    yield ""
+    yield f"**Period:** Last {days} days"
+    yield f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}"
+    yield ""
 
     if changes:
         # Group by date
@@ -211,8 +220,8 @@ def generate_changelog(db: Database, days: int = 7, tool_id: Optional[int] = Non
             changes_by_date[date].append(change)
 
         for date, date_changes in changes_by_date.items():
-            lines.append(f"## {date}")
-            lines.append("")
+            yield f"## {date}"
+            yield ""
             for change in date_changes:
                 icon = {
                     'new': '🆕',
@@ -223,36 +232,43 @@ def generate_changelog(db: Database, days: int = 7, tool_id: Optional[int] = Non
                     'news': '📰',
                 }.get(change['change_type'], '•')
 
-                lines.append(f"- {icon} **{change['tool_name']}** [{change['change_type']}]: {change['description']}")
-            lines.append("")
+                yield f"- {icon} **{change['tool_name']}** [{change['change_type']}]: {change['description']}"
+            yield ""
     else:
-        lines.append(f"*No changes recorded in the last {days} days.*")
-        lines.append("")
+        yield f"*No changes recorded in the last {days} days.*"
+        yield ""
 
-    lines.append("---")
-    lines.append("*Generated by Glean*")
+    yield "---"
+    yield "*Generated by Glean*"
 
-    return '\n'.join(lines)
 
+def generate_changelog(db: Database, days: int = 7, tool_id: Optional[int] = None) -> str:
+    """Generate a changelog in Markdown format.
 
-def generate_tools_index(db: Database) -> str:
-    """Generate a Markdown index of all approved tools.
+    Args:
+        db: Database connection
+        days: Number of days to include
+        tool_id: Optional specific tool ID to filter by
 
     Returns:
-        Markdown formatted tools index
+        Markdown formatted changelog string
     """
+    return '\n'.join(iter_changelog(db, days, tool_id))
+
+
+def iter_tools_index(db: Database) -> Iterator[str]:
+    """Yield the Markdown index of approved tools line by line."""
     tools = db.get_tools_by_status('approved')
 
-    lines = []
-    lines.append("# AI Sales Tools Index")
-    lines.append("")
-    lines.append(f"**Total tools:** {len(tools)}")
-    lines.append(f"**Last updated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-    lines.append("")
+    yield "# AI Sales Tools Index"
+    yield ""
+    yield f"**Total tools:** {len(tools)}"
+    yield f"**Last updated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}"
+    yield ""
 
     if not tools:
-        lines.append("*No tools approved yet.*")
-        return '\n'.join(lines)
+        yield "*No tools approved yet.*"
+        return
 
     # Group by category
     by_category: dict[str, list[dict[str, Any]]] = {}
@@ -271,8 +287,8 @@ def generate_tools_index(db: Database) -> str:
             continue
 
         cat_tools = by_category[cat]
-        lines.append(f"## {cat.title()}")
-        lines.append("")
+        yield f"## {cat.title()}"
+        yield ""
 
         # Sort by relevance score
         cat_tools.sort(key=lambda t: t.get('relevance_score') or 0, reverse=True)
@@ -280,20 +296,27 @@ def generate_tools_index(db: Database) -> str:
         for tool in cat_tools:
             url = tool.get('url', '')
             if url:
-                lines.append(f"- **[{tool['name']}]({url})**")
+                yield f"- **[{tool['name']}]({url})**"
             else:
-                lines.append(f"- **{tool['name']}**")
+                yield f"- **{tool['name']}**"
 
             if tool.get('description'):
                 desc = tool['description'][:100] + ('...' if len(tool['description']) > 100 else '')
-                lines.append(f"  {desc}")
+                yield f"  {desc}"
+
+        yield ""
 
-        lines.append("")
+    yield "---"
+    yield "*Generated by Glean*"
 
-    lines.append("---")
-    lines.append("*Generated by Glean*")
 
-    return '\n'.join(lines)
+def generate_tools_index(db: Database) -> str:
+    """Generate a Markdown index of all approved tools.
+
+    Returns:
+        Markdown formatted tools index
+    """
+    return '\n'.join(iter_tools_index(db))
 
 
 def save_report(content: str, filename: str, output_dir: str = "reports") -> Path:
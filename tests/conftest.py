@@ -55,6 +55,53 @@ def temp_db_path():
         pass
 
 
+@pytest.fixture
+def update_interval_hours():
+    """Hours between scheduled update checks; 0 disables the scheduler."""
+    return "0"
+
+
+@pytest.fixture
+def api_client(temp_db, update_interval_hours, monkeypatch):
+    """Create a FastAPI test client backed by the temp database.
+
+    The app's startup runs migrations against the same file, so tables
+    that only migrations create (jobs, settings) exist as well.
+    """
+    from fastapi.testclient import TestClient
+
+    from web.api import deps
+    from web.api.main import app
+
+    monkeypatch.setenv("GLEAN_DB_PATH", str(temp_db.db_path))
+    monkeypatch.setenv("GLEAN_ENVIRONMENT", "test")
+    monkeypatch.setenv("GLEAN_UPDATE_INTERVAL_HOURS", update_interval_hours)
+    app.dependency_overrides[deps.get_db] = lambda: temp_db
+
+    with TestClient(app) as client:
+        yield client
+
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def auth_headers(api_client):
+    """Register a user and return auth headers for api_client."""
+    api_client.post(
+        "/api/auth/register",
+        json={
+            "username": "admin",
+            "email": "admin@test.com",
+            "password": "password123"
+        }
+    )
+    response = api_client.post(
+        "/api/auth/login",
+        json={"username": "admin", "password": "password123"}
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
 @pytest.fixture
 def isolated_filesystem(tmp_path):
     """Run test in an isolated filesystem."""
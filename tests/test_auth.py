@@ -412,6 +412,37 @@ class TestAuthAPIEndpoints:
         assert data["username"] == "testuser"
         assert data["email"] == "test@test.com"
 
+    def test_current_user_cached_between_requests(self, client, temp_db):
+        """Test that the user row is cached and dropped on login."""
+        client.post(
+            "/api/auth/register",
+            json={
+                "username": "testuser",
+                "email": "test@test.com",
+                "password": "password123"
+            }
+        )
+        login_response = client.post(
+            "/api/auth/login",
+            json={"username": "testuser", "password": "password123"}
+        )
+        headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+        client.get("/api/auth/me", headers=headers)
+
+        conn = temp_db.connect()
+        conn.execute("UPDATE users SET email = 'new@test.com'")
+        conn.commit()
+
+        response = client.get("/api/auth/me", headers=headers)
+        assert response.json()["email"] == "test@test.com"
+
+        client.post(
+            "/api/auth/login",
+            json={"username": "testuser", "password": "password123"}
+        )
+        response = client.get("/api/auth/me", headers=headers)
+        assert response.json()["email"] == "new@test.com"
+
     def test_get_current_user_no_token(self, client):
         """Test getting current user without token fails."""
         response = client.get("/api/auth/me")
@@ -0,0 +1,91 @@
+"""
+Tests for the in-memory API cache.
+"""
+
+from web.api.cache import TTLCache
+
+
+class FakeTimer:
+    """Manually advanced clock for TTL tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_get_and_set(self):
+        """Test basic get/set/contains."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache["a"] = 1
+
+        assert cache["a"] == 1
+        assert "a" in cache
+        assert cache.get("missing") is None
+        assert "missing" not in cache
+
+    def test_evicts_least_recently_used(self):
+        """Test that the LRU entry is evicted when full."""
+        evicted = []
+        cache = TTLCache(maxsize=2, ttl=60, on_evict=lambda k, v: evicted.append(k))
+        cache["a"] = 1
+        cache["b"] = 2
+        cache.get("a")  # "b" is now least recently used
+        cache["c"] = 3
+
+        assert "b" not in cache
+        assert cache["a"] == 1
+        assert evicted == ["b"]
+
+    def test_entries_expire(self):
+        """Test that entries expire after the TTL."""
+        timer = FakeTimer()
+        evicted = []
+        cache = TTLCache(maxsize=10, ttl=5, on_evict=lambda k, v: evicted.append((k, v)),
+                         timer=timer)
+        cache["a"] = 1
+        timer.now = 4
+        assert cache["a"] == 1
+
+        timer.now = 5
+        assert cache.get("a") is None
+        assert evicted == [("a", 1)]
+
+    def test_values_skips_expired(self):
+        """Test that values() drops expired entries."""
+        timer = FakeTimer()
+        cache = TTLCache(maxsize=10, ttl=5, timer=timer)
+        cache["a"] = 1
+        timer.now = 3
+        cache["b"] = 2
+        timer.now = 6
+
+        assert cache.values() == [2]
+        assert len(cache) == 1
+
+    def test_pop_does_not_notify(self):
+        """Test that explicit removal does not trigger on_evict."""
+        evicted = []
+        cache = TTLCache(maxsize=10, ttl=60, on_evict=lambda k, v: evicted.append(k))
+        cache["a"] = 1
+
+        assert cache.pop("a") == 1
+        assert cache.pop("a", "gone") == "gone"
+        assert evicted == []
+
+    def test_cache_info_counts_hits_and_misses(self):
+        """Test that lookups are counted, including expired entries as misses."""
+        timer = FakeTimer()
+        cache = TTLCache(maxsize=2, ttl=10, timer=timer)
+        cache["a"] = 1
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        timer.now = 10
+        assert cache.get("a") is None
+
+        assert cache.cache_info() == {"hits": 1, "misses": 2, "maxsize": 2, "size": 0}
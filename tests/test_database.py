@@ -3,6 +3,7 @@ Tests for the Glean Database module.
 """
 
 import os
+import sqlite3
 
 import pytest
 
@@ -138,6 +139,43 @@ class TestToolOperations:
         assert tool['status'] == "rejected"
         assert tool['rejection_reason'] == "Not relevant"
 
+    def test_bulk_tool_operations(self, temp_db):
+        """Test updating and deleting several tools at once."""
+        db = temp_db
+
+        ids = [db.add_tool(name=f"Tool {i}", url=f"https://tool{i}.com") for i in range(3)]
+        db.add_changelog_entries([(ids[0], "new", "Tool approved: Tool 0")])
+
+        names = db.update_tools_status([ids[1], 999], "approved", changelog="Approved: {name}")
+        assert names == {ids[1]: "Tool 1"}
+        changes = {c["description"] for c in db.get_recent_changes()}
+        assert changes == {"Tool approved: Tool 0", "Approved: Tool 1"}
+
+        db.update_tools_status(ids[:2], "approved")
+        assert [db.get_tool(i)['status'] for i in ids] == ["approved", "approved", "inbox"]
+        assert db.get_tool(ids[0])['reviewed_at'] is not None
+
+        assert db.delete_tools([ids[0], ids[1], 999]) == {ids[0], ids[1]}
+        assert db.delete_tools([]) == set()
+        assert [db.get_tool(i) is not None for i in ids] == [False, False, True]
+
+    def test_delete_tools_rolls_back_on_error(self, temp_db):
+        """Test that a failed bulk delete leaves claims in place."""
+        db = temp_db
+
+        tool_id = db.add_tool(name="Tool", url="https://tool.com")
+        source_id = db.get_source_by_name("reddit")["id"]
+        db.add_claim(tool_id, source_id, "Sends emails")
+        # Discoveries reference tools without ON DELETE, so the delete fails
+        discovery_id = db.add_discovery(source_id, "https://reddit.com/r/x", "Tool")
+        db.mark_discovery_processed(discovery_id, tool_id)
+
+        with pytest.raises(sqlite3.IntegrityError):
+            db.delete_tools([tool_id])
+
+        db.connect().commit()
+        assert len(db.get_claims_for_tool(tool_id)) == 1
+
 class TestDiscoveryOperations:
     """Tests for discovery operations."""
 
@@ -386,3 +424,10 @@ class TestDatabaseConnection:
         # Should be accessible by key
         assert tool['name'] == "Test"
         assert tool['status'] == "inbox"
+
+    def test_wal_mode(self, temp_db):
+        """Test that connections use WAL journaling with NORMAL sync."""
+        conn = temp_db.connect()
+
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
@@ -0,0 +1,205 @@
+"""
+Tests for the Glean jobs API.
+
+Covers:
+- Running jobs on the worker pools
+- Job status polling and listing
+- Recovery of jobs interrupted by a restart
+"""
+
+import time
+
+import pytest
+
+
+def wait_for_job(client, headers, job_id, timeout=10.0):
+    """Poll a job until it reaches a terminal status."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = client.get(f"/api/jobs/{job_id}", headers=headers).json()
+        if job["status"] in ("completed", "failed", "cancelled"):
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"Job {job_id} did not finish in {timeout}s")
+
+
+class TestJobsAPI:
+    """Tests for job endpoints using FastAPI TestClient."""
+
+    def test_curate_job_completes(self, api_client, auth_headers):
+        """Test that a curate job runs to completion on the worker pool."""
+        response = api_client.post("/api/jobs/curate", json={}, headers=auth_headers)
+        assert response.status_code == 200
+
+        job = wait_for_job(api_client, auth_headers, response.json()["job_id"])
+
+        assert job["status"] == "completed"
+        assert job["progress"] == 100
+        assert job["result"]["tools_scored"] == 0
+        assert job["logs"][-1]["message"] == "Job completed successfully"
+
+    def test_scout_job_completes(self, api_client, auth_headers):
+        """Test that a demo scout job saves discoveries."""
+        response = api_client.post(
+            "/api/jobs/scout", json={"scout_type": "rss"}, headers=auth_headers
+        )
+        assert response.status_code == 200
+
+        job = wait_for_job(api_client, auth_headers, response.json()["job_id"])
+
+        assert job["status"] == "completed"
+        assert job["result"]["mode"] == "demo"
+
+    def test_list_jobs(self, api_client, auth_headers):
+        """Test that finished jobs are listed."""
+        job_id = api_client.post("/api/jobs/curate", json={}, headers=auth_headers).json()["job_id"]
+        wait_for_job(api_client, auth_headers, job_id)
+
+        response = api_client.get("/api/jobs", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert [j["id"] for j in response.json()["jobs"]] == [job_id]
+
+    def test_scout_types(self, api_client, auth_headers):
+        """Test that scout types are served with a cache header."""
+        response = api_client.get("/api/jobs/scout-types", headers=auth_headers)
+
+        assert response.status_code == 200
+        ids = [t["id"] for t in response.json()["scout_types"]]
+        assert ids == ["reddit", "twitter", "producthunt", "web", "rss", "all"]
+        assert "max-age" in response.headers["cache-control"]
+
+    def test_get_unknown_job(self, api_client, auth_headers):
+        """Test that an unknown job returns 404."""
+        response = api_client.get("/api/jobs/missing", headers=auth_headers)
+        assert response.status_code == 404
+
+    def test_recover_interrupted_jobs(self, api_client, temp_db):
+        """Test that jobs left running by a previous process are failed."""
+        temp_db.create_job("stale1", "scout", "reddit")
+        temp_db.update_job("stale1", status="running")
+        temp_db.create_job("done1", "curate")
+        temp_db.update_job("done1", status="completed", completed=True)
+
+        assert temp_db.fail_interrupted_jobs() == 1
+
+        assert temp_db.get_job("stale1")["status"] == "failed"
+        assert temp_db.get_job("done1")["status"] == "completed"
+
+    def test_update_jobs_batch(self, api_client, temp_db):
+        """Test that batched job updates append logs and set completion."""
+        temp_db.create_job("job1", "scout", "rss")
+        temp_db.create_job("job2", "curate")
+        log = {"timestamp": "2026-01-01T00:00:00", "level": "info", "message": "one"}
+
+        temp_db.update_jobs_batch([
+            {"id": "job1", "status": "running", "progress": 10, "message": "Running",
+             "result": None, "error": None, "logs": [log], "completed": False},
+            {"id": "job2", "status": "completed", "progress": 100, "message": "Done",
+             "result": {"tools_scored": 3}, "error": None, "logs": [log, log],
+             "completed": True},
+        ])
+        temp_db.update_jobs_batch([
+            {"id": "job1", "status": "running", "progress": 50, "message": "Running",
+             "result": None, "error": None, "logs": [log], "completed": False},
+        ])
+
+        job1 = temp_db.get_job("job1")
+        assert job1["progress"] == 50
+        assert len(job1["logs"]) == 2
+        assert job1["completed_at"] is None
+
+        job2 = temp_db.get_job("job2")
+        assert job2["result"] == {"tools_scored": 3}
+        assert len(job2["logs"]) == 2
+        assert job2["completed_at"] is not None
+
+    @pytest.mark.parametrize("update_interval_hours", [str(0.1 / 3600)])
+    def test_scheduled_update_check(self, api_client, auth_headers):
+        """Test that the scheduler queues update checks on its own."""
+        time.sleep(0.5)
+
+        jobs = api_client.get("/api/jobs", headers=auth_headers).json()["jobs"]
+        assert jobs
+        assert all(job["type"] == "update" for job in jobs)
+
+    def test_all_scouts_job_completes(self, api_client, auth_headers):
+        """Test that running every scout at once aggregates their results."""
+        response = api_client.post(
+            "/api/jobs/scout", json={"scout_type": "all"}, headers=auth_headers
+        )
+        assert response.status_code == 200
+
+        job = wait_for_job(api_client, auth_headers, response.json()["job_id"], timeout=30.0)
+
+        assert job["status"] == "completed"
+        assert job["progress"] == 100
+        finished = [log["message"].split(":")[0] for log in job["logs"]
+                    if "discoveries," in log["message"] and ":" in log["message"]]
+        assert sorted(finished) == ["producthunt", "reddit", "rss", "twitter", "web"]
+
+    def test_flush_writes_jobs_no_longer_cached(self, api_client, temp_db):
+        """Test that queued changes are written even after the job leaves the cache."""
+        from web.api.routers import jobs
+
+        temp_db.create_job("wb2", "curate", None, None, None)
+        job = jobs.Job(id="wb2", type=jobs.JobType.CURATE, status=jobs.JobStatus.RUNNING)
+        job.progress = 40
+        jobs._mark_dirty(job)
+        assert jobs._cache_get("wb2") is None
+
+        jobs.flush_dirty_jobs(temp_db)
+
+        assert "wb2" not in jobs._dirty
+        row = temp_db.get_job("wb2")
+        assert (row["status"], row["progress"]) == ("running", 40)
+
+
+class TestJobWriteBack:
+    """Tests for deferred job writes."""
+
+    def test_log_only_changes_are_not_queued(self):
+        """Test that a job is only queued when status or progress moves."""
+        from web.api.routers import jobs
+
+        job = jobs.Job(id="wb1", type=jobs.JobType.CURATE, status=jobs.JobStatus.RUNNING)
+        job._synced_state = (job.status, job.progress)
+        try:
+            job.add_log("Still working")
+            jobs._mark_dirty(job)
+            assert "wb1" not in jobs._dirty
+
+            job.progress = 50
+            jobs._mark_dirty(job)
+            assert "wb1" in jobs._dirty
+        finally:
+            jobs._dirty.pop("wb1", None)
+
+    def test_running_jobs_do_not_expire(self, monkeypatch):
+        """Test that only queued jobs expire, and expiry defers the write."""
+        from web.api.cache import TTLCache
+        from web.api.routers import jobs
+
+        now = [0.0]
+        monkeypatch.setattr(jobs, "_job_cache", TTLCache(
+            maxsize=8, ttl=10, on_evict=jobs._on_job_evicted, timer=lambda: now[0]
+        ))
+        running = jobs.Job(id="wb3", type=jobs.JobType.SCOUT, status=jobs.JobStatus.PENDING)
+        queued = jobs.Job(id="wb4", type=jobs.JobType.UPDATE, status=jobs.JobStatus.PENDING)
+        try:
+            jobs._cache_set(running)
+            jobs._cache_set(queued)
+            assert jobs._claim_job("wb3") is running
+
+            now[0] = 60
+            assert jobs._cache_get("wb3") is running
+            assert jobs._cache_get("wb4") is None
+            assert jobs._dirty["wb4"] is queued
+            assert jobs._active_jobs() == [running]
+
+            # A runner reaching an evicted job still picks it up
+            assert jobs._claim_job("wb4") is queued
+        finally:
+            jobs._cache_remove("wb3")
+            jobs._cache_remove("wb4")
+            jobs._dirty.pop("wb4", None)
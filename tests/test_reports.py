@@ -0,0 +1,87 @@
+"""
+Tests for Glean report generation.
+
+Covers:
+- Markdown report generators
+- Chunked streaming of raw reports
+- Caching across invalidations
+"""
+
+import asyncio
+
+from src.reporters import generate_tools_index, iter_tools_index
+from web.api.cache import TTLCache
+from web.api.routers import reports
+from web.api.routers.reports import _chunk_lines
+
+
+class TestReportGenerators:
+    """Tests for report generator functions."""
+
+    def test_tools_index_empty(self, temp_db):
+        """Test the index when no tools are approved."""
+        report = generate_tools_index(temp_db)
+
+        assert report.startswith("# AI Sales Tools Index")
+        assert report.endswith("*No tools approved yet.*")
+
+    def test_tools_index_lists_approved_tools(self, temp_db):
+        """Test that only approved tools appear in the index."""
+        temp_db.add_tool(name="Tool 1", url="https://tool1.com", status="approved",
+                         category="outreach")
+        temp_db.add_tool(name="Tool 2", url="https://tool2.com", status="inbox")
+
+        report = generate_tools_index(temp_db)
+
+        assert "## Outreach" in report
+        assert "**[Tool 1](https://tool1.com)**" in report
+        assert "Tool 2" not in report
+
+
+class TestReportStreaming:
+    """Tests for chunking report lines into streamed output."""
+
+    def test_chunks_join_to_full_report(self, temp_db):
+        """Test that streamed chunks reproduce the generated report exactly."""
+        for i in range(30):
+            temp_db.add_tool(name=f"Tool {i}", url=f"https://tool{i}.com",
+                             description="A tool", status="approved")
+
+        chunks = list(_chunk_lines(iter_tools_index(temp_db), size=7))
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == generate_tools_index(temp_db)
+
+    def test_chunk_lines_edge_cases(self):
+        """Test chunking of empty input and exact multiples of size."""
+        assert list(_chunk_lines([], size=2)) == []
+        assert "".join(_chunk_lines(["a", "", "b", "c"], size=2)) == "a\n\nb\nc"
+
+
+class TestReportCache:
+    """Tests for rendered report caching."""
+
+    def test_report_invalidated_mid_render_not_cached(self, monkeypatch):
+        """Test that a report rendered across an invalidation is not stored."""
+        monkeypatch.setattr(reports, "_report_cache", TTLCache(maxsize=4, ttl=300))
+
+        def lines():
+            yield "# Report"
+            reports.invalidate_report_cache()
+            yield "stale line"
+
+        async def consume(response):
+            return [chunk async for chunk in response.body_iterator]
+
+        asyncio.run(consume(reports._stream_report(("index",), lines())))
+        assert ("index",) not in reports._report_cache
+
+        def generate():
+            reports.invalidate_report_cache()
+            return "stale"
+
+        assert reports._get_report(("weekly", 1), generate)[0] == "stale"
+        assert ("weekly", 1) not in reports._report_cache
+
+        asyncio.run(consume(reports._stream_report(("index",), iter(["# Report"]))))
+        assert reports._report_cache.get(("index",))[0] == "# Report"
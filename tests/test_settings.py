@@ -0,0 +1,313 @@
+"""
+Tests for the Glean settings API.
+
+Covers:
+- Service configuration status
+- Reading and writing settings
+"""
+
+import asyncio
+from typing import get_args
+
+import httpx
+import pytest
+
+from web.api.cache import TTLCache
+from web.api.routers import settings as settings_router
+from web.api.routers.settings import (
+    SERVICE_GROUPS,
+    Category,
+    ServiceId,
+    get_setting_metadata,
+    is_service_configured,
+    mask_secret,
+)
+
+
+class TestMaskSecret:
+    """Tests for secret masking."""
+
+    def test_short_values_fully_masked(self):
+        """Test that empty and short values show only bullets."""
+        assert mask_secret("") == "••••••••"
+        assert mask_secret("abc") == "••••••••"
+
+    def test_keeps_first_and_last_four(self):
+        """Test that the middle of a secret is replaced one-for-one."""
+        assert mask_secret("sk-ant-abcdef1234") == "sk-a•••••••••1234"
+
+    def test_very_long_value(self):
+        """Test that long values are masked to their full length."""
+        masked = mask_secret("a" * 300)
+        assert len(masked) == 300
+        assert masked[4:-4] == "•" * 292
+
+
+class TestSettingMetadata:
+    """Tests for setting metadata lookup."""
+
+    def test_known_setting(self):
+        """Test that defined settings return their schema entry."""
+        meta = get_setting_metadata("scouts", "reddit_post_limit")
+        assert meta["label"] == "Reddit Post Limit"
+        assert meta["default"] == "50"
+
+    def test_unknown_setting_fallback(self):
+        """Test that unknown settings get a label derived from the key."""
+        meta = get_setting_metadata("scouts", "hacker_news_limit")
+        assert meta == {
+            "label": "Hacker News Limit", "description": "", "placeholder": ""
+        }
+
+
+class TestCredentialChecks:
+    """Tests for credential checks against mocked upstream APIs."""
+
+    def test_anthropic_key_checked_by_listing_models(self, monkeypatch):
+        """Test that Anthropic keys are validated without a completion call."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            valid = request.headers["x-api-key"] == "good"
+            return httpx.Response(200 if valid else 401, json={"data": []})
+
+        async def check(key):
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            monkeypatch.setattr(settings_router, "_http_client", client)
+            try:
+                return await settings_router._test_anthropic(key)
+            finally:
+                await client.aclose()
+
+        assert asyncio.run(check("good"))["success"] is True
+        assert asyncio.run(check("bad")) == {"success": False, "message": "Invalid API key"}
+        assert all(r.method == "GET" and r.url.path == "/v1/models" for r in requests)
+
+    def test_openai_clients_closed_only_on_shutdown(self, monkeypatch):
+        """Test that evicted OpenAI clients stay usable until shutdown."""
+        class FakeClient:
+            closed = False
+
+            def close(self):
+                self.closed = True
+
+        cache = TTLCache(maxsize=1, ttl=60)
+        monkeypatch.setattr(settings_router, "_openai_clients", cache)
+        evicted, kept = FakeClient(), FakeClient()
+        cache["a"] = evicted
+        cache["b"] = kept
+
+        assert evicted.closed is False
+
+        asyncio.run(settings_router.close_http_client())
+
+        assert kept.closed is True
+        assert len(cache) == 0
+
+
+class TestSettingsAPI:
+    """Tests for settings endpoints using FastAPI TestClient."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_caches(self, monkeypatch):
+        """Give each test empty settings caches and rate limits."""
+        monkeypatch.setattr(
+            settings_router, "_settings_cache", TTLCache(maxsize=16, ttl=60)
+        )
+        monkeypatch.setattr(
+            settings_router, "_test_attempts", TTLCache(maxsize=16, ttl=60)
+        )
+        monkeypatch.setattr(
+            settings_router, "_services_cache", TTLCache(maxsize=16, ttl=60)
+        )
+
+    def test_services_configuration_status(self, api_client, auth_headers):
+        """Test that services report which credentials are set."""
+        api_client.put(
+            "/api/settings/services/twitter/field",
+            params={"field_key": "bearer_token", "value": "token-1234567890"},
+            headers=auth_headers,
+        )
+
+        response = api_client.get("/api/settings/services", headers=auth_headers)
+
+        assert response.status_code == 200
+        services = {s["id"]: s for s in response.json()["services"]}
+        assert services["twitter"]["is_configured"] is True
+        assert services["twitter"]["fields"][0]["value"] == "toke••••••••7890"
+        assert services["reddit"]["is_configured"] is False
+        assert services["websearch"]["selected_provider"] == "serpapi"
+
+        api_client.put(
+            "/api/settings/services/websearch/provider",
+            params={"provider_id": "google"},
+            headers=auth_headers,
+        )
+        services = api_client.get("/api/settings/services", headers=auth_headers).json()["services"]
+        assert services[-1]["selected_provider"] == "google"
+
+    def test_is_service_configured(self, api_client, auth_headers, temp_db):
+        """Test required-field checks for simple and provider services."""
+        user_id = temp_db.get_user_by_username("admin")["id"]
+        temp_db.set_setting(user_id, "api_keys", "websearch_provider", "google")
+        temp_db.set_setting(user_id, "api_keys", "websearch_google_api_key", "key", is_secret=True)
+
+        assert is_service_configured(temp_db, user_id, "websearch") is False
+
+        temp_db.set_setting(user_id, "api_keys", "websearch_google_cx", "cx", is_secret=True)
+
+        assert is_service_configured(temp_db, user_id, "websearch") is True
+        assert is_service_configured(temp_db, user_id, "anthropic") is False
+
+    def test_category_settings(self, api_client, auth_headers):
+        """Test reading and updating settings in a category."""
+        response = api_client.put(
+            "/api/settings/scouts/reddit_subreddits",
+            json={"value": "sales,startups"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert response.json() == {
+            "success": True, "category": "scouts", "key": "reddit_subreddits"
+        }
+
+        scouts = api_client.get("/api/settings/scouts", headers=auth_headers).json()
+        assert scouts["reddit_subreddits"]["value"] == "sales,startups"
+        assert scouts["reddit_subreddits"]["is_set"] is True
+
+        all_settings = api_client.get("/api/settings", headers=auth_headers).json()
+        assert set(all_settings) == {"api_keys", "scouts", "analyzers"}
+        assert all_settings["scouts"]["reddit_subreddits"]["is_set"] is True
+
+    def test_invalid_category_or_key(self, api_client, auth_headers):
+        """Test that unknown categories and keys are rejected."""
+        assert set(get_args(Category)) == {"api_keys", "scouts", "analyzers"}
+        assert api_client.get("/api/settings/bogus", headers=auth_headers).status_code == 422
+        response = api_client.put(
+            "/api/settings/scouts/bogus", json={"value": "x"}, headers=auth_headers
+        )
+        assert response.status_code == 400
+
+    def test_update_rejects_unexpected_fields(self, api_client, auth_headers):
+        """Test that update bodies with unknown or oversized fields fail validation."""
+        response = api_client.put(
+            "/api/settings/scouts/reddit_post_limit",
+            json={"value": "25", "label": "x"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 422
+
+        response = api_client.put(
+            "/api/settings/scouts/reddit_post_limit",
+            json={"value": "x" * 8193},
+            headers=auth_headers,
+        )
+        assert response.status_code == 422
+
+    def test_schema_etag(self, api_client, auth_headers):
+        """Test that the schema is served with an ETag and revalidates."""
+        response = api_client.get("/api/settings/schema", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert set(response.json()) == {"api_keys", "scouts", "analyzers"}
+        etag = response.headers["etag"]
+
+        cached = api_client.get(
+            "/api/settings/schema", headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert cached.status_code == 304
+
+    def test_bulk_update(self, api_client, auth_headers):
+        """Test saving several settings in one request."""
+        response = api_client.put(
+            "/api/settings",
+            json={"updates": [
+                {"category": "scouts", "key": "reddit_subreddits", "value": "sales"},
+                {"category": "api_keys", "key": "anthropic", "value": "sk-ant-1234567890"},
+            ]},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["updated"] == 2
+
+        all_settings = api_client.get("/api/settings", headers=auth_headers).json()
+        assert all_settings["scouts"]["reddit_subreddits"]["value"] == "sales"
+        assert all_settings["api_keys"]["anthropic"]["is_secret"] is True
+        assert all_settings["api_keys"]["anthropic"]["value"] == "sk-a•••••••••7890"
+
+    def test_bulk_update_rejects_unknown_keys(self, api_client, auth_headers):
+        """Test that one invalid entry rejects the whole bulk update."""
+        response = api_client.put(
+            "/api/settings",
+            json={"updates": [
+                {"category": "scouts", "key": "reddit_subreddits", "value": "sales"},
+                {"category": "scouts", "key": "bogus", "value": "x"},
+            ]},
+            headers=auth_headers,
+        )
+        assert response.status_code == 400
+
+        scouts = api_client.get("/api/settings/scouts", headers=auth_headers).json()
+        assert scouts["reddit_subreddits"]["is_set"] is False
+
+    def test_settings_reads_cached_until_write(self, api_client, auth_headers, temp_db):
+        """Test that reads are cached and API writes invalidate them."""
+        api_client.get("/api/settings", headers=auth_headers)
+
+        user_id = temp_db.get_user_by_username("admin")["id"]
+        temp_db.set_setting(user_id, "scouts", "reddit_subreddits", "direct")
+
+        scouts = api_client.get("/api/settings/scouts", headers=auth_headers).json()
+        assert scouts["reddit_subreddits"]["is_set"] is False
+
+        api_client.put(
+            "/api/settings/scouts/reddit_post_limit",
+            json={"value": "25"},
+            headers=auth_headers,
+        )
+
+        scouts = api_client.get("/api/settings/scouts", headers=auth_headers).json()
+        assert scouts["reddit_subreddits"]["value"] == "direct"
+        assert scouts["reddit_post_limit"]["value"] == "25"
+
+    def test_test_services_bulk(self, api_client, auth_headers):
+        """Test checking several services in one request."""
+        response = api_client.post(
+            "/api/settings/test-services",
+            json={"service_ids": ["anthropic", "twitter"]},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert results["anthropic"] == {"success": False, "message": "API key not configured"}
+        assert results["twitter"]["message"] == "Bearer token not configured"
+
+        response = api_client.post(
+            "/api/settings/test-services",
+            json={"service_ids": ["anthropic", "bogus"]},
+            headers=auth_headers,
+        )
+        assert response.status_code == 422
+
+    def test_unknown_service_rejected(self, api_client, auth_headers):
+        """Test that service IDs are validated against the defined services."""
+        assert set(get_args(ServiceId)) == set(SERVICE_GROUPS)
+
+        response = api_client.post("/api/settings/test-service/bogus", headers=auth_headers)
+        assert response.status_code == 422
+
+    def test_credential_tests_rate_limited(self, api_client, auth_headers):
+        """Test that repeated tests of one service are throttled."""
+        for _ in range(settings_router.TEST_RATE_LIMIT):
+            response = api_client.post("/api/settings/test-service/twitter", headers=auth_headers)
+            assert response.status_code == 200
+
+        response = api_client.post("/api/settings/test-service/twitter", headers=auth_headers)
+        assert response.status_code == 429
+        assert int(response.headers["retry-after"]) > 0
+
+        # Other services have their own budget
+        response = api_client.post("/api/settings/test-service/reddit", headers=auth_headers)
+        assert response.status_code == 200
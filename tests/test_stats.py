@@ -0,0 +1,52 @@
+"""
+Tests for the Glean stats API.
+
+Covers:
+- Pipeline counts and activity log
+- Short-lived response caching
+"""
+
+import pytest
+
+from web.api.cache import TTLCache
+from web.api.routers import stats as stats_router
+
+
+class TestStatsAPI:
+    """Tests for stats endpoints using FastAPI TestClient."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self, monkeypatch):
+        """Give each test an empty response cache."""
+        monkeypatch.setattr(stats_router, "_stats_cache", TTLCache(maxsize=16, ttl=60))
+
+    def test_stats_and_activity(self, api_client, auth_headers, temp_db):
+        """Test that stats and activity reflect the database."""
+        tool_id = temp_db.add_tool(name="Tool 1", url="https://tool1.com")
+        temp_db.add_changelog_entry(tool_id, "new", "Tool approved: Tool 1")
+
+        stats = api_client.get("/api/stats", headers=auth_headers).json()
+        assert stats["inbox"] == 1
+        assert stats["total_tools"] == 1
+
+        activities = api_client.get("/api/activity", headers=auth_headers).json()["activities"]
+        assert [a["tool_name"] for a in activities] == ["Tool 1"]
+
+    def test_responses_cached(self, api_client, auth_headers, temp_db):
+        """Test that repeated polls are served from the cache."""
+        assert api_client.get("/api/stats", headers=auth_headers).json()["total_tools"] == 0
+        api_client.get("/api/activity", params={"limit": 5}, headers=auth_headers)
+
+        tool_id = temp_db.add_tool(name="Tool 1", url="https://tool1.com")
+        temp_db.add_changelog_entry(tool_id, "new", "Tool approved: Tool 1")
+
+        assert api_client.get("/api/stats", headers=auth_headers).json()["total_tools"] == 0
+        response = api_client.get("/api/activity", params={"limit": 5}, headers=auth_headers)
+        assert response.json()["activities"] == []
+
+        # A different limit is a different cache entry
+        response = api_client.get("/api/activity", params={"limit": 10}, headers=auth_headers)
+        assert len(response.json()["activities"]) == 1
+
+        info = api_client.get("/api/stats/cache", headers=auth_headers).json()
+        assert (info["hits"], info["misses"]) == (2, 3)
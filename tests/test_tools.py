@@ -0,0 +1,159 @@
+"""
+Tests for the Glean tools API.
+
+Covers:
+- Tool detail with claims, changelog and discoveries
+- Bulk status updates and deletes
+"""
+
+from contextlib import ExitStack
+
+
+class TestToolsAPI:
+    """Tests for tools endpoints using FastAPI TestClient."""
+
+    def test_get_tool_detail(self, api_client, auth_headers, temp_db):
+        """Test that tool detail includes claims, changelog and discoveries."""
+        tool_id = temp_db.add_tool(name="Tool 1", url="https://tool1.com")
+        source_id = temp_db.get_source_by_name("reddit")["id"]
+        temp_db.add_claim(tool_id, source_id, "Sends emails", claim_type="feature")
+        temp_db.add_claim(tool_id, source_id, "Free tier", claim_type="pricing", confidence=0.9)
+        temp_db.add_changelog_entry(tool_id, "new", "Tool approved: Tool 1")
+        discovery_id = temp_db.add_discovery(source_id, "https://reddit.com/r/x", "Tool 1 is great")
+        temp_db.mark_discovery_processed(discovery_id, tool_id)
+
+        response = api_client.get(f"/api/tools/{tool_id}", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["name"] == "Tool 1"
+        assert [c["content"] for c in data["claims"]] == ["Free tier", "Sends emails"]
+        assert data["claims"] == temp_db.get_claims_for_tool(tool_id)
+        assert len(data["changelog"]) == 1
+        assert [d["id"] for d in data["discoveries"]] == [discovery_id]
+
+    def test_get_missing_tool(self, api_client, auth_headers):
+        """Test that unknown tools return 404."""
+        assert api_client.get("/api/tools/999", headers=auth_headers).status_code == 404
+
+    def test_list_tools_filters_and_total(self, api_client, auth_headers, temp_db):
+        """Test listing with a status filter, pagination and total count."""
+        for i in range(3):
+            temp_db.add_tool(name=f"Approved {i}", url=f"https://a{i}.com", status="approved")
+        temp_db.add_tool(name="Inbox", url="https://inbox.com")
+
+        response = api_client.get(
+            "/api/tools", params={"status": "approved", "limit": 2}, headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 3
+        assert len(data["tools"]) == 2
+        assert {t["status"] for t in data["tools"]} == {"approved"}
+        assert data["filters"]["status"] == "approved"
+        assert "_total" not in data["tools"][0]
+
+        response = api_client.get(
+            "/api/tools", params={"status": "approved", "offset": 10}, headers=auth_headers
+        )
+        assert response.json()["tools"] == []
+        assert response.json()["total"] == 3
+
+    def test_list_tools_search(self, api_client, auth_headers, temp_db):
+        """Test full-text search over names and descriptions."""
+        temp_db.add_tool(name="Mailer", url="https://mailer.com", description="Sends cold emails")
+        tool_id = temp_db.add_tool(name="Dialer", url="https://dialer.com", description="Calls leads")
+        temp_db.add_tool(name="Other", url="https://other.com")
+
+        def names(search):
+            response = api_client.get("/api/tools", params={"search": search}, headers=auth_headers)
+            assert response.status_code == 200
+            return {t["name"] for t in response.json()["tools"]}
+
+        assert names("email") == {"Mailer"}
+        assert names("dial") == {"Dialer"}
+        assert names('call "leads') == {"Dialer"}
+
+        api_client.put(f"/api/tools/{tool_id}", json={"name": "Caller"}, headers=auth_headers)
+        assert names("dial") == set()
+        assert names("caller") == {"Caller"}
+
+    def test_approve_and_update(self, api_client, auth_headers, temp_db):
+        """Test that approval logs to the changelog and missing tools 404."""
+        tool_id = temp_db.add_tool(name="Tool 1", url="https://tool1.com")
+
+        response = api_client.put(
+            f"/api/tools/{tool_id}/status", json={"status": "approved"}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        detail = api_client.get(f"/api/tools/{tool_id}", headers=auth_headers).json()
+        assert detail["status"] == "approved"
+        assert [c["description"] for c in detail["changelog"]] == ["Tool approved: Tool 1"]
+
+        response = api_client.put(f"/api/tools/{tool_id}", json={"category": "crm"}, headers=auth_headers)
+        assert response.json()["tool"]["category"] == "crm"
+
+        response = api_client.put("/api/tools/999/status", json={"status": "approved"}, headers=auth_headers)
+        assert response.status_code == 404
+        response = api_client.put("/api/tools/999", json={"name": "x"}, headers=auth_headers)
+        assert response.status_code == 404
+
+    def test_update_requires_fields(self, api_client, auth_headers, temp_db):
+        """Test that empty updates are rejected and unknown fields ignored."""
+        tool_id = temp_db.add_tool(name="Tool 1", url="https://tool1.com")
+
+        response = api_client.put(f"/api/tools/{tool_id}", json={"status": "x"}, headers=auth_headers)
+        assert response.status_code == 400
+
+        response = api_client.put(
+            f"/api/tools/{tool_id}",
+            json={"relevance_score": 0.5, "name": "Renamed"},
+            headers=auth_headers,
+        )
+        tool = response.json()["tool"]
+        assert (tool["name"], tool["relevance_score"]) == ("Renamed", 0.5)
+
+    def test_claims_and_delete(self, api_client, auth_headers, temp_db):
+        """Test claim listing and deletion, including missing tools."""
+        tool_id = temp_db.add_tool(name="Tool 1", url="https://tool1.com")
+
+        assert api_client.get(f"/api/tools/{tool_id}/claims", headers=auth_headers).json() == {"claims": []}
+        assert api_client.get("/api/tools/999/claims", headers=auth_headers).status_code == 404
+
+        temp_db.add_changelog_entry(tool_id, "new", "Tool approved: Tool 1")
+        response = api_client.delete(f"/api/tools/{tool_id}", headers=auth_headers)
+        assert response.json() == {"success": True, "deleted_tool_id": tool_id}
+        assert temp_db.get_recent_changes() == []
+        assert api_client.delete(f"/api/tools/{tool_id}", headers=auth_headers).status_code == 404
+
+    def test_bulk_status_and_delete(self, api_client, auth_headers, temp_db):
+        """Test that bulk operations report updated and missing tools."""
+        ids = [temp_db.add_tool(name=f"Tool {i}", url=f"https://t{i}.com") for i in range(2)]
+
+        response = api_client.put(
+            "/api/tools/bulk/status",
+            json={"tool_ids": [ids[0], 999], "status": "review"},
+            headers=auth_headers,
+        )
+        assert response.json()["updated"] == [ids[0]]
+        assert response.json()["not_found"] == [999]
+
+        response = api_client.request(
+            "DELETE", "/api/tools/bulk", json=[*ids, 999], headers=auth_headers
+        )
+        assert response.json()["deleted"] == ids
+        assert response.json()["not_found"] == [999]
+
+    def test_read_connections_pooled(self, api_client, auth_headers):
+        """Test that offloaded reads reuse a bounded set of connections."""
+        from web.api import deps
+
+        with ExitStack() as stack:
+            held = [stack.enter_context(deps.pooled_db()) for _ in range(deps._DB_POOL_SIZE + 2)]
+        assert deps._db_pool.qsize() == deps._DB_POOL_SIZE
+
+        assert api_client.get("/api/tools", headers=auth_headers).status_code == 200
+        assert deps._db_pool.qsize() == deps._DB_POOL_SIZE
+        with deps.pooled_db() as db:
+            assert db in held
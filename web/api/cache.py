@@ -0,0 +1,123 @@
+"""
+In-Memory Cache
+
+Bounded, thread-safe caches for API state and computed responses.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLCache(Generic[K, V]):
+    """LRU cache whose entries also expire a fixed time after being set.
+
+    When full, the least recently used entry is evicted. The optional
+    on_evict callback receives (key, value) for entries dropped by size or
+    age - not for explicit pop() or clear() - and runs outside the cache
+    lock so it may safely touch the cache again.
+
+    Lookups through get() (and so [] and in) are counted as hits or
+    misses; cache_info() reports them.
+    """
+
+    def __init__(self, maxsize: int, ttl: float,
+                 on_evict: Optional[Callable[[K, V], None]] = None,
+                 timer: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._on_evict = on_evict
+        self._timer = timer
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: K, default=None):
+        """Get a value, or default if missing or expired."""
+        evicted = []
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                value = default
+            elif item[0] <= self._timer():
+                del self._data[key]
+                evicted.append((key, item[1]))
+                self.misses += 1
+                value = default
+            else:
+                self._data.move_to_end(key)
+                self.hits += 1
+                value = item[1]
+        self._notify(evicted)
+        return value
+
+    def __getitem__(self, key: K) -> V:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        with self._lock:
+            self._data[key] = (self._timer() + self.ttl, value)
+            self._data.move_to_end(key)
+            evicted = self._expire()
+            while len(self._data) > self.maxsize:
+                old_key, (_, old_value) = self._data.popitem(last=False)
+                evicted.append((old_key, old_value))
+        self._notify(evicted)
+
+    def __contains__(self, key: K) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def cache_info(self) -> dict:
+        """Hit and miss counts along with the current and maximum size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "maxsize": self.maxsize,
+                "size": len(self._data),
+            }
+
+    def pop(self, key: K, default=None):
+        """Remove a key and return its value, or default if missing."""
+        with self._lock:
+            item = self._data.pop(key, None)
+        return item[1] if item is not None else default
+
+    def values(self) -> list[V]:
+        """Snapshot of all live values, least recently used first."""
+        with self._lock:
+            evicted = self._expire()
+            values = [value for _, value in self._data.values()]
+        self._notify(evicted)
+        return values
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def _expire(self) -> list[tuple[K, V]]:
+        """Drop expired entries. Caller must hold the lock."""
+        now = self._timer()
+        expired = [key for key, (expires, _) in self._data.items() if expires <= now]
+        return [(key, self._data.pop(key)[1]) for key in expired]
+
+    def _notify(self, evicted: list[tuple[K, V]]) -> None:
+        if self._on_evict:
+            for key, value in evicted:
+                self._on_evict(key, value)
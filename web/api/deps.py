@@ -5,17 +5,33 @@ Shared dependencies for API routers.
 """
 
 import os
-from typing import Optional
+import queue
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, TypeVar
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from starlette.concurrency import run_in_threadpool
 
 from src.database import Database
 from web.api.auth import decode_access_token
+from web.api.cache import TTLCache
+
+T = TypeVar("T")
 
 # Global database instance
 _db: Optional[Database] = None
 
+# Idle connections for reads offloaded from the event loop to worker
+# threads. Connections beyond the pool size are closed when returned.
+_DB_POOL_SIZE = 8
+_db_pool: "queue.LifoQueue[Database]" = queue.LifoQueue(maxsize=_DB_POOL_SIZE)
+
+# User rows looked up by authenticated requests. Tokens are still verified
+# on every request; this only saves the query. Cached dicts are shared
+# between requests and must not be mutated.
+_user_cache: TTLCache[int, dict] = TTLCache(maxsize=10_000, ttl=60)
+
 # Security scheme
 security = HTTPBearer(auto_error=False)
 
@@ -34,9 +50,66 @@ def get_db() -> Database:
     return _db
 
 
+def open_db() -> Database:
+    """Open a dedicated database connection.
+
+    SQLite connections are bound to the thread that created them, so code
+    running on a worker thread must use its own connection instead of the
+    shared one returned by get_db().
+    """
+    return Database(get_db_path())
+
+
+@contextmanager
+def pooled_db() -> Iterator[Database]:
+    """Check out a database connection for use on a worker thread.
+
+    Reuses an idle connection from the pool when one is available, so
+    queries offloaded with run_in_threadpool don't open a connection per
+    request, and returns it to the pool afterwards.
+    """
+    try:
+        db = _db_pool.get_nowait()
+    except queue.Empty:
+        # Handed between worker threads, but only used by one at a time
+        db = Database(get_db_path(), check_same_thread=False)
+    try:
+        yield db
+    finally:
+        try:
+            _db_pool.put_nowait(db)
+        except queue.Full:
+            db.close()
+
+
+async def run_with_db(func: Callable[..., T], *args) -> T:
+    """Run func(db, *args) on a threadpool worker with a pooled connection."""
+    def call() -> T:
+        with pooled_db() as db:
+            return func(db, *args)
+
+    return await run_in_threadpool(call)
+
+
+def get_user(db: Database, user_id: int) -> Optional[dict]:
+    """Get a user by ID, from cache if looked up in the last minute."""
+    user = _user_cache.get(user_id)
+    if user is None:
+        user = db.get_user_by_id(user_id)
+        if user is not None:
+            _user_cache[user_id] = user
+    return user
+
+
+def invalidate_user(user_id: int) -> None:
+    """Drop a cached user after its row changes."""
+    _user_cache.pop(user_id, None)
+
+
 def init_db():
     """Initialize database on startup."""
     global _db
+    _user_cache.clear()
     db_path = get_db_path()
     print(f"Initializing database at: {db_path}")
     _db = Database(db_path)
@@ -47,9 +120,15 @@ def init_db():
 def close_db():
     """Close database on shutdown."""
     global _db
+    _user_cache.clear()
     if _db:
         _db.close()
         _db = None
+    while True:
+        try:
+            _db_pool.get_nowait().close()
+        except queue.Empty:
+            break
 
 
 async def get_current_user(
@@ -75,7 +154,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = db.get_user_by_id(token_data.user_id)
+    user = get_user(db, token_data.user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -107,7 +186,7 @@ async def get_current_user_optional(
     if token_data is None:
         return None
 
-    user = db.get_user_by_id(token_data.user_id)
+    user = get_user(db, token_data.user_id)
     if user is None or not user.get("is_active"):
         return None
 
@@ -4,16 +4,21 @@ Glean Web API
 FastAPI backend for the Glean web interface.
 """
 
+import asyncio
 import os
 from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Optional
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 
+from web.api import worker
 from web.api.deps import close_db, init_db
+from web.api.responses import ORJSONResponse
 
 # Check if running in production (static files exist)
 FRONTEND_DIR = Path(__file__).parent.parent / "frontend" / "dist"
@@ -37,13 +42,39 @@ def run_migrations():
         print(f"Warning: Migration check failed: {e}")
 
 
+def recover_interrupted_jobs():
+    """Fail jobs orphaned by a previous shutdown or crash."""
+    try:
+        recovered = jobs.recover_interrupted_jobs()
+        if recovered:
+            print(f"Marked {recovered} interrupted job(s) as failed")
+    except Exception as e:
+        print(f"Warning: Job recovery failed: {e}")
+
+
+def start_update_scheduler() -> Optional[asyncio.Task]:
+    """Start periodic update checks (GLEAN_UPDATE_INTERVAL_HOURS, 0 disables)."""
+    hours = float(os.environ.get("GLEAN_UPDATE_INTERVAL_HOURS", "1"))
+    if hours <= 0:
+        return None
+    return asyncio.create_task(jobs.run_update_scheduler(hours * 3600))
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifecycle."""
     # Run migrations before initializing DB
     run_migrations()
     init_db()
+    recover_interrupted_jobs()
+    jobs.start_flusher()
+    scheduler = start_update_scheduler()
     yield
+    if scheduler:
+        scheduler.cancel()
+    worker.shutdown()
+    jobs.stop_flusher()
+    await settings.close_http_client()
     close_db()
 
 
@@ -52,6 +83,7 @@ app = FastAPI(
     description="API for the Glean intelligence gathering system",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware for frontend (development)
@@ -68,6 +100,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large responses such as streamed reports and exports
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 # Import and include routers after app is created
 from web.api.routers import auth, export, jobs, reports, settings, stats, tools  # noqa: E402
 
@@ -0,0 +1,21 @@
+"""
+Response Classes
+
+JSON responses rendered with orjson.
+"""
+
+from typing import Any
+
+import orjson
+from starlette.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson straight to bytes.
+
+    Used as the app's default response class. Non-string dict keys are
+    stringified as the stdlib encoder would.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
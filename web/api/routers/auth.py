@@ -16,7 +16,7 @@ from web.api.auth import (
     hash_password,
     verify_password,
 )
-from web.api.deps import get_current_user, get_db
+from web.api.deps import get_current_user, get_db, invalidate_user
 
 router = APIRouter()
 
@@ -143,6 +143,7 @@ async def login(credentials: UserLogin, db: Database = Depends(get_db)):
 
     # Update last login
     db.update_last_login(user["id"])
+    invalidate_user(user["id"])
 
     # Create token (sub must be a string per JWT spec)
     access_token = create_access_token(
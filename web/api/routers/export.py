@@ -13,19 +13,20 @@ from typing import Optional
 from fastapi import APIRouter, Depends, Query
 from fastapi.responses import StreamingResponse
 
+from src.database import Database
 from web.api.deps import get_current_user, get_db
 
 router = APIRouter()
 
 
 def _get_tools_data(
+    db: Database,
     status: Optional[str] = None,
     category: Optional[str] = None,
     min_score: Optional[float] = None,
     max_score: Optional[float] = None,
 ) -> list[dict]:
     """Get tools data with optional filters."""
-    db = get_db()
     conn = db.connect()
 
     query = "SELECT * FROM tools WHERE 1=1"
@@ -53,9 +54,8 @@ def _get_tools_data(
     return [dict(row) for row in rows]
 
 
-def _get_claims_data(tool_ids: Optional[list[int]] = None) -> list[dict]:
+def _get_claims_data(db: Database, tool_ids: Optional[list[int]] = None) -> list[dict]:
     """Get claims data, optionally filtered by tool IDs."""
-    db = get_db()
     conn = db.connect()
 
     query = """
@@ -90,12 +90,12 @@ async def export_tools_json(
     max_score: Optional[float] = Query(None, ge=0, le=1, description="Maximum relevance score"),
     include_claims: bool = Query(False, description="Include claims for each tool"),
     current_user: dict = Depends(get_current_user),
+    db: Database = Depends(get_db),
 ):
     """Export tools to JSON format."""
-    tools = _get_tools_data(status, category, min_score, max_score)
+    tools = _get_tools_data(db, status, category, min_score, max_score)
 
     if include_claims:
-        db = get_db()
         for tool in tools:
             tool["claims"] = db.get_claims_for_tool(tool["id"])
 
@@ -129,9 +129,10 @@ async def export_tools_csv(
     min_score: Optional[float] = Query(None, ge=0, le=1, description="Minimum relevance score"),
     max_score: Optional[float] = Query(None, ge=0, le=1, description="Maximum relevance score"),
     current_user: dict = Depends(get_current_user),
+    db: Database = Depends(get_db),
 ):
     """Export tools to CSV format."""
-    tools = _get_tools_data(status, category, min_score, max_score)
+    tools = _get_tools_data(db, status, category, min_score, max_score)
 
     # Define CSV columns
     columns = [
@@ -159,10 +160,11 @@ async def export_tools_csv(
 async def export_claims_json(
     tool_id: Optional[int] = Query(None, description="Filter by tool ID"),
     current_user: dict = Depends(get_current_user),
+    db: Database = Depends(get_db),
 ):
     """Export claims to JSON format."""
     tool_ids = [tool_id] if tool_id else None
-    claims = _get_claims_data(tool_ids)
+    claims = _get_claims_data(db, tool_ids)
 
     export_data = {
         "exported_at": datetime.utcnow().isoformat(),
@@ -188,10 +190,11 @@ async def export_claims_json(
 async def export_claims_csv(
     tool_id: Optional[int] = Query(None, description="Filter by tool ID"),
     current_user: dict = Depends(get_current_user),
+    db: Database = Depends(get_db),
 ):
     """Export claims to CSV format."""
     tool_ids = [tool_id] if tool_id else None
-    claims = _get_claims_data(tool_ids)
+    claims = _get_claims_data(db, tool_ids)
 
     columns = [
         "id", "tool_id", "tool_name", "claim_type", "content",
@@ -217,13 +220,13 @@ async def export_claims_csv(
 @router.get("/all/json")
 async def export_all_json(
     current_user: dict = Depends(get_current_user),
+    db: Database = Depends(get_db),
 ):
     """Export all data (tools, claims, changelog) to JSON."""
-    db = get_db()
     conn = db.connect()
 
     # Get all tools with claims
-    tools = _get_tools_data()
+    tools = _get_tools_data(db)
     for tool in tools:
         tool["claims"] = db.get_claims_for_tool(tool["id"])
 
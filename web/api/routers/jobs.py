@@ -4,16 +4,35 @@ Jobs Router
 Background job management for scouts, analyzers, etc.
 """
 
+import asyncio
 import os
-import uuid
+import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
-from pydantic import BaseModel
-
-from web.api.deps import get_current_user, get_db
+from fastapi import APIRouter, Depends, HTTPException, Response
+from pydantic import BaseModel, PrivateAttr
+
+from src.analyzers import run_analyzer
+from src.curator import run_curation
+from src.database import Database
+from src.scouts import (
+    ProductHuntScout,
+    run_reddit_scout,
+    run_rss_scout,
+    run_twitter_scout,
+    run_websearch_scout,
+)
+from src.tracker import run_update_check
+from web.api import worker
+from web.api.cache import TTLCache
+from web.api.deps import get_current_user, get_db, open_db
+from web.api.responses import ORJSONResponse
+from web.api.routers.reports import invalidate_report_cache
 from web.api.routers.settings import is_service_configured
 
 router = APIRouter()
@@ -43,6 +62,59 @@ class ScoutType(str, Enum):
     ALL = "all"
 
 
+# Response for /scout-types, built once at import
+SCOUT_TYPES_RESPONSE = {
+    "scout_types": [
+        {
+            "id": "reddit",
+            "name": "Reddit",
+            "description": "Scout Reddit for AI tool mentions",
+            "icon": "reddit",
+            "requires_api": True,
+        },
+        {
+            "id": "twitter",
+            "name": "Twitter/X",
+            "description": "Scout Twitter for AI tool mentions",
+            "icon": "twitter",
+            "requires_api": True,
+        },
+        {
+            "id": "producthunt",
+            "name": "Product Hunt",
+            "description": "Scout Product Hunt for new AI tool launches",
+            "icon": "producthunt",
+            "requires_api": True,
+        },
+        {
+            "id": "web",
+            "name": "Web Search",
+            "description": "Scout web search results for AI tools",
+            "icon": "search",
+            "requires_api": True,
+        },
+        {
+            "id": "rss",
+            "name": "RSS Feeds",
+            "description": "Scout RSS feeds for AI tool mentions",
+            "icon": "rss",
+            "requires_api": False,
+        },
+        {
+            "id": "all",
+            "name": "All Sources",
+            "description": "Run all scouts",
+            "icon": "globe",
+            "requires_api": True,
+        },
+    ]
+}
+
+
+# Local time to the second, matching datetime.isoformat() without microseconds
+LOG_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
 class LogEntry(BaseModel):
     """Log entry model."""
     timestamp: str
@@ -65,13 +137,22 @@ class Job(BaseModel):
     logs: list[LogEntry] = []
     user_id: Optional[int] = None
 
+    # Log entries as plain dicts, serialized once when added
+    _logs_serialized: list[dict] = PrivateAttr(default_factory=list)
+    # Number of log entries already written to the database
+    _synced_logs: int = PrivateAttr(default=0)
+    # (status, progress) as of the last database write
+    _synced_state: Optional[tuple] = PrivateAttr(default=None)
+
     def add_log(self, message: str, level: str = "info") -> None:
         """Add a log entry to the job."""
-        self.logs.append(LogEntry(
-            timestamp=datetime.now().isoformat(),
+        entry = LogEntry(
+            timestamp=time.strftime(LOG_TIMESTAMP_FORMAT),
             level=level,
             message=message,
-        ))
+        )
+        self.logs.append(entry)
+        self._logs_serialized.append(entry.model_dump())
 
 
 class ScoutConfig(BaseModel):
@@ -103,8 +184,84 @@ class CurateConfig(BaseModel):
     auto_merge: bool = True
 
 
-# In-memory cache for active jobs (synced with database)
-_job_cache: dict[str, Job] = {}
+def _on_job_evicted(job_id: str, job: Job) -> None:
+    """Queue a job's latest state for write-back when it leaves the cache.
+
+    Eviction can happen on the event loop, so the write is left to the
+    flush thread.
+    """
+    with _sync_lock:
+        _dirty[job_id] = job
+
+
+# Jobs claimed by a runner, until the runner's finally removes them. Never
+# expired: a long scout or analyze run must stay visible and keep flushing.
+_running_jobs: dict[str, Job] = {}
+
+# Jobs waiting for a worker. Bounded so jobs that are never picked up (e.g.
+# dropped at shutdown) cannot accumulate for the process lifetime.
+_job_cache: TTLCache[str, Job] = TTLCache(
+    maxsize=512, ttl=3600, on_evict=_on_job_evicted
+)
+
+
+# Active-job cache access. The cache is local to this process; the database
+# is the state shared between processes, kept at most one flush interval
+# behind for running jobs and written immediately on terminal transitions.
+
+
+def _cache_get(job_id: str) -> Optional[Job]:
+    """Get an active job owned by this process."""
+    return _running_jobs.get(job_id) or _job_cache.get(job_id)
+
+
+def _cache_set(job: Job) -> None:
+    """Track a job as active in this process."""
+    _job_cache[job.id] = job
+
+
+def _cache_remove(job_id: str) -> None:
+    """Stop tracking a job once it has finished."""
+    _running_jobs.pop(job_id, None)
+    _job_cache.pop(job_id, None)
+
+
+def _active_jobs() -> list[Job]:
+    """All jobs this process is running or has queued."""
+    return [*_running_jobs.values(), *_job_cache.values()]
+
+
+def _claim_job(job_id: str) -> Optional[Job]:
+    """Move a queued job into the running set as its runner starts.
+
+    A job that waited in its queue past the cache TTL was evicted, so it
+    is recovered from the write-back queue or the database rather than
+    skipped. Returns None if the job no longer exists or is not pending.
+    """
+    job = _job_cache.pop(job_id)
+    if job is None:
+        with _sync_lock:
+            job = _dirty.get(job_id)
+        if job is None:
+            db = open_db()
+            try:
+                job = get_job_from_db(job_id, db)
+            finally:
+                db.close()
+        if job is None or job.status != JobStatus.PENDING:
+            return None
+    _running_jobs[job_id] = job
+    return job
+
+
+# Write-back state: active jobs with changes not yet flushed to the database,
+# held by reference so flushing does not depend on the job cache. Terminal
+# transitions are written immediately; everything else is batched.
+FLUSH_INTERVAL_SECONDS = 2.0
+_dirty: dict[str, Job] = {}
+_sync_lock = threading.RLock()
+_flush_stop = threading.Event()
+_flush_thread: Optional[threading.Thread] = None
 
 
 # ============================================================================
@@ -184,9 +341,11 @@ def _determine_analyzer_mode(db, user_id: Optional[int]) -> tuple[bool, str]:
 
 
 def create_job(job_type: JobType, scout_type: Optional[str] = None,
-               config: Optional[dict] = None, user_id: Optional[int] = None) -> Job:
+               config: Optional[dict] = None, user_id: Optional[int] = None,
+               db: Optional[Database] = None) -> Job:
     """Create a new job and persist to database."""
-    job_id = str(uuid.uuid4())[:8]
+    # 64 random bits - an 8-char UUID prefix risks collisions within ~65k jobs
+    job_id = secrets.token_hex(8)
     job = Job(
         id=job_id,
         type=job_type,
@@ -197,26 +356,39 @@ def create_job(job_type: JobType, scout_type: Optional[str] = None,
     )
 
     # Persist to database
-    db = get_db()
+    if db is None:
+        db = get_db()
     db.create_job(job_id, job_type.value, scout_type, config, user_id)
 
     # Cache for active job tracking
-    _job_cache[job_id] = job
+    _cache_set(job)
     return job
 
 
-def get_job_from_db(job_id: str) -> Optional[Job]:
+def recover_interrupted_jobs() -> int:
+    """Fail jobs that were queued or running when the server last stopped.
+
+    Worker pools live in the API process, so these jobs can never finish.
+    """
+    db = get_db()
+    return db.fail_interrupted_jobs()
+
+
+def get_job_from_db(job_id: str, db: Optional[Database] = None) -> Optional[Job]:
     """Get job from cache or database."""
     # Check cache first for active jobs
-    if job_id in _job_cache:
-        return _job_cache[job_id]
+    job = _cache_get(job_id)
+    if job:
+        return job
 
     # Load from database
-    db = get_db()
+    if db is None:
+        db = get_db()
     job_data = db.get_job(job_id)
     if job_data:
-        logs = [LogEntry(**log) for log in (job_data.get('logs') or [])]
-        return Job(
+        # Rows were written from validated models, so skip re-validation
+        logs = [LogEntry.model_construct(**log) for log in (job_data.get('logs') or [])]
+        job = Job.model_construct(
             id=job_data['id'],
             type=JobType(job_data['type']),
             status=JobStatus(job_data['status']),
@@ -230,38 +402,118 @@ def get_job_from_db(job_id: str) -> Optional[Job]:
             logs=logs,
             user_id=job_data.get('user_id'),
         )
+        job._logs_serialized = job_data.get('logs') or []
+        job._synced_logs = len(logs)
+        return job
     return None
 
 
-def sync_job_to_db(job: Job) -> None:
-    """Sync job state to database."""
-    db = get_db()
-    logs_data = [log.model_dump() for log in job.logs]
-    db.update_job(
-        job.id,
-        status=job.status.value,
-        progress=job.progress,
-        message=job.message,
-        result=job.result,
-        error=job.error,
-        logs=logs_data,
-        completed=job.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
-    )
+def _job_update(job: Job) -> dict:
+    """Build a batch update row for a job, with logs added since last sync."""
+    return {
+        "id": job.id,
+        "status": job.status.value,
+        "progress": job.progress,
+        "message": job.message,
+        "result": job.result,
+        "error": job.error,
+        "logs": job._logs_serialized[job._synced_logs:],
+        "completed": job.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED),
+    }
+
+
+def _write_jobs(jobs: list[Job], db: Database) -> None:
+    """Write several jobs in one batch. Caller must hold _sync_lock."""
+    updates = [_job_update(job) for job in jobs]
+    db.update_jobs_batch(updates)
+    for job, update in zip(jobs, updates):
+        job._synced_logs += len(update["logs"])
+        job._synced_state = (job.status, job.progress)
+        _dirty.pop(job.id, None)
+
+
+def sync_job_to_db(job: Job, db: Optional[Database] = None) -> None:
+    """Sync job state to database.
+
+    Only log entries added since the last sync are written. Job runners
+    execute on worker threads and must pass their own connection.
+    """
+    if db is None:
+        db = get_db()
+    with _sync_lock:
+        _write_jobs([job], db)
+
+
+def _mark_dirty(job: Job) -> None:
+    """Queue a job's in-progress state for the next background flush.
+
+    Changes that leave status and progress as last written - typically
+    just new log lines - are not queued. Readers get active jobs from the
+    cache, and the logs go out with the next progress or terminal write.
+    """
+    with _sync_lock:
+        if (job.status, job.progress) != job._synced_state:
+            _dirty[job.id] = job
+
 
+def flush_dirty_jobs(db: Optional[Database] = None) -> None:
+    """Write all pending job changes to the database in one batch."""
+    with _sync_lock:
+        # Finished jobs were already written, and unqueued, by their terminal sync
+        jobs = list(_dirty.values())
+        _dirty.clear()
+        if jobs:
+            _write_jobs(jobs, db or get_db())
 
-async def run_scout_job(job_id: str, config: ScoutConfig):
-    """Run scout job in background."""
-    job = _job_cache.get(job_id)
+
+def _flush_loop() -> None:
+    """Flush dirty jobs every interval until stopped, then flush once more."""
+    db = open_db()
+    try:
+        while not _flush_stop.wait(FLUSH_INTERVAL_SECONDS):
+            try:
+                flush_dirty_jobs(db)
+            except Exception as e:
+                print(f"Warning: Job flush failed: {e}")
+        flush_dirty_jobs(db)
+    finally:
+        db.close()
+
+
+def start_flusher() -> None:
+    """Start the background thread that writes back in-progress job state.
+
+    Flushing runs on its own thread so SQLite writes never block the
+    event loop.
+    """
+    global _flush_thread
+    _flush_stop.clear()
+    _flush_thread = threading.Thread(target=_flush_loop, name="glean-job-flush", daemon=True)
+    _flush_thread.start()
+
+
+def stop_flusher() -> None:
+    """Stop the flush thread after a final flush."""
+    global _flush_thread
+    _flush_stop.set()
+    if _flush_thread is not None:
+        _flush_thread.join()
+        _flush_thread = None
+
+
+def run_scout_job(job_id: str, config: ScoutConfig):
+    """Run scout job on the scout worker pool."""
+    job = _claim_job(job_id)
     if not job:
         return
 
+    db = open_db()
     job.status = JobStatus.RUNNING
     job.add_log("Starting scout job", "info")
-    sync_job_to_db(job)
+    _mark_dirty(job)
     scout_type = config.scout_type
 
     try:
-        db = get_db()
         total_saved = 0
         total_skipped = 0
 
@@ -271,7 +523,8 @@ async def run_scout_job(job_id: str, config: ScoutConfig):
         job.add_log(f"Mode: {mode_label} ({mode_reason})", "info")
 
         if scout_type == ScoutType.ALL:
-            # Run all scouts
+            # Scouts are independent, so run them side by side; results and
+            # progress are recorded here as each one finishes
             scouts_to_run = [
                 ScoutType.REDDIT,
                 ScoutType.TWITTER,
@@ -279,24 +532,34 @@ async def run_scout_job(job_id: str, config: ScoutConfig):
                 ScoutType.WEB,
                 ScoutType.RSS,
             ]
-            for i, st in enumerate(scouts_to_run):
-                job.message = f"Running {st.value} scout..."
-                job.progress = int((i / len(scouts_to_run)) * 90)
-                job.add_log(f"Running {st.value} scout...", "info")
-                sync_job_to_db(job)
-
-                saved, skipped, _ = run_single_scout(
-                    db, st, config, job.user_id, use_demo=use_demo
-                )
-                total_saved += saved
-                total_skipped += skipped
-                job.add_log(f"{st.value}: {saved} discoveries, {skipped} duplicates", "info")
+            job.message = f"Running {len(scouts_to_run)} scouts..."
+            job.progress = 5
+            job.add_log(
+                f"Running {', '.join(st.value for st in scouts_to_run)} scouts in parallel...",
+                "info"
+            )
+            _mark_dirty(job)
+
+            with ThreadPoolExecutor(max_workers=len(scouts_to_run),
+                                    thread_name_prefix="scout-all") as pool:
+                futures = {
+                    pool.submit(_run_scout_with_own_db, st, config, job.user_id, use_demo): st
+                    for st in scouts_to_run
+                }
+                for done, future in enumerate(as_completed(futures), start=1):
+                    st = futures[future]
+                    saved, skipped, _ = future.result()
+                    total_saved += saved
+                    total_skipped += skipped
+                    job.progress = 5 + int((done / len(scouts_to_run)) * 85)
+                    job.add_log(f"{st.value}: {saved} discoveries, {skipped} duplicates", "info")
+                    _mark_dirty(job)
 
         else:
             job.message = f"Running {scout_type.value} scout..."
             job.progress = 10
             job.add_log(f"Running {scout_type.value} scout...", "info")
-            sync_job_to_db(job)
+            _mark_dirty(job)
 
             total_saved, total_skipped, run_info = run_single_scout(
                 db, scout_type, config, job.user_id, use_demo=use_demo
@@ -336,7 +599,7 @@ async def run_scout_job(job_id: str, config: ScoutConfig):
         }
         job.completed_at = datetime.now().isoformat()
         job.add_log("Job completed successfully", "success")
-        sync_job_to_db(job)
+        sync_job_to_db(job, db)
 
     except Exception as e:
         job.status = JobStatus.FAILED
@@ -344,10 +607,11 @@ async def run_scout_job(job_id: str, config: ScoutConfig):
         job.message = f"Failed: {str(e)}"
         job.completed_at = datetime.now().isoformat()
         job.add_log(f"Job failed: {str(e)}", "error")
-        sync_job_to_db(job)
+        sync_job_to_db(job, db)
     finally:
         # Remove from cache when done
-        _job_cache.pop(job_id, None)
+        _cache_remove(job_id)
+        db.close()
 
 
 def _check_scout_credentials(db, scout_type: ScoutType,
@@ -405,7 +669,6 @@ def run_single_scout(db, scout_type: ScoutType, config: ScoutConfig,
     scout_config = {'demo': use_demo}
 
     if scout_type == ScoutType.REDDIT:
-        from src.scouts.reddit import run_reddit_scout
         scout_config['post_limit'] = config.limit
         scout_config['include_comments'] = True
         if config.subreddits:
@@ -427,7 +690,6 @@ def run_single_scout(db, scout_type: ScoutType, config: ScoutConfig,
         return saved, skipped, None
 
     elif scout_type == ScoutType.TWITTER:
-        from src.scouts.twitter import run_twitter_scout
         scout_config['max_results'] = config.limit
         if config.queries:
             scout_config['search_queries'] = config.queries
@@ -442,7 +704,6 @@ def run_single_scout(db, scout_type: ScoutType, config: ScoutConfig,
         return saved, skipped, None
 
     elif scout_type == ScoutType.PRODUCTHUNT:
-        from src.scouts.producthunt import ProductHuntScout
         scout_config['days_back'] = config.days_back
         scout_config['min_votes'] = config.min_votes
         # Load Product Hunt credentials from user settings
@@ -464,7 +725,6 @@ def run_single_scout(db, scout_type: ScoutType, config: ScoutConfig,
             scout.close()
 
     elif scout_type == ScoutType.WEB:
-        from src.scouts.websearch import run_websearch_scout
         scout_config['results_per_query'] = config.results_per_query
         if config.queries:
             scout_config['search_queries'] = config.queries
@@ -491,7 +751,6 @@ def run_single_scout(db, scout_type: ScoutType, config: ScoutConfig,
         return saved, skipped, None
 
     elif scout_type == ScoutType.RSS:
-        from src.scouts.rss import run_rss_scout
         scout_config['max_age_days'] = config.max_age_days
         if config.feeds:
             scout_config['feeds'] = [
@@ -504,22 +763,30 @@ def run_single_scout(db, scout_type: ScoutType, config: ScoutConfig,
     return (0, 0, None)
 
 
-async def run_analyze_job(job_id: str, config: AnalyzeConfig):
-    """Run analyzer job in background."""
-    job = _job_cache.get(job_id)
+def _run_scout_with_own_db(scout_type: ScoutType, config: ScoutConfig,
+                           user_id: Optional[int],
+                           use_demo: bool) -> tuple[int, int, Optional[dict]]:
+    """Run a single scout on its own connection, for use off the job thread."""
+    db = open_db()
+    try:
+        return run_single_scout(db, scout_type, config, user_id, use_demo=use_demo)
+    finally:
+        db.close()
+
+
+def run_analyze_job(job_id: str, config: AnalyzeConfig):
+    """Run analyzer job on the analyze worker pool."""
+    job = _claim_job(job_id)
     if not job:
         return
 
+    db = open_db()
     job.status = JobStatus.RUNNING
     job.message = "Starting analyzer..."
     job.add_log("Starting analyzer job", "info")
-    sync_job_to_db(job)
+    _mark_dirty(job)
 
     try:
-        from src.analyzers import run_analyzer
-
-        db = get_db()
-
         # Auto-detect mode based on environment and credentials
         use_mock, mode_reason = _determine_analyzer_mode(db, job.user_id)
         mode_label = "MOCK" if use_mock else "REAL"
@@ -538,7 +805,7 @@ async def run_analyze_job(job_id: str, config: AnalyzeConfig):
         job.progress = 10
         job.message = "Analyzing discoveries..."
         job.add_log(f"Analyzing up to {config.limit} discoveries", "info")
-        sync_job_to_db(job)
+        _mark_dirty(job)
 
         result = run_analyzer(db, analyzer_config, use_mock=use_mock)
 
@@ -558,7 +825,7 @@ async def run_analyze_job(job_id: str, config: AnalyzeConfig):
         if result['errors'] > 0:
             job.add_log(f"{result['errors']} errors during processing", "warning")
         job.add_log("Job completed successfully", "success")
-        sync_job_to_db(job)
+        sync_job_to_db(job, db)
 
     except Exception as e:
         job.status = JobStatus.FAILED
@@ -566,31 +833,31 @@ async def run_analyze_job(job_id: str, config: AnalyzeConfig):
         job.message = f"Failed: {str(e)}"
         job.completed_at = datetime.now().isoformat()
         job.add_log(f"Job failed: {str(e)}", "error")
-        sync_job_to_db(job)
+        sync_job_to_db(job, db)
     finally:
-        _job_cache.pop(job_id, None)
+        _cache_remove(job_id)
+        # Reports read the tools, claims and changelog this job may have changed
+        invalidate_report_cache()
+        db.close()
 
 
-async def run_curate_job(job_id: str, config: CurateConfig):
-    """Run curation job in background."""
-    job = _job_cache.get(job_id)
+def run_curate_job(job_id: str, config: CurateConfig):
+    """Run curation job on the curate worker pool."""
+    job = _claim_job(job_id)
     if not job:
         return
 
+    db = open_db()
     job.status = JobStatus.RUNNING
     job.message = "Starting curation..."
     job.add_log("Starting curation job", "info")
-    sync_job_to_db(job)
+    _mark_dirty(job)
 
     try:
-        from src.curator import run_curation
-
-        db = get_db()
-
         job.progress = 10
         job.message = "Scoring and ranking tools..."
         job.add_log(f"Scoring tools (min_score={config.min_score}, auto_merge={config.auto_merge})", "info")
-        sync_job_to_db(job)
+        _mark_dirty(job)
 
         result = run_curation(
             db,
@@ -613,7 +880,7 @@ async def run_curate_job(job_id: str, config: CurateConfig):
         if result.duplicates_merged > 0:
             job.add_log(f"Merged {result.duplicates_merged} duplicates", "info")
         job.add_log("Job completed successfully", "success")
-        sync_job_to_db(job)
+        sync_job_to_db(job, db)
 
     except Exception as e:
         job.status = JobStatus.FAILED
@@ -621,31 +888,31 @@ async def run_curate_job(job_id: str, config: CurateConfig):
         job.message = f"Failed: {str(e)}"
         job.completed_at = datetime.now().isoformat()
         job.add_log(f"Job failed: {str(e)}", "error")
-        sync_job_to_db(job)
+        sync_job_to_db(job, db)
     finally:
-        _job_cache.pop(job_id, None)
+        _cache_remove(job_id)
+        # Reports read the tools, claims and changelog this job may have changed
+        invalidate_report_cache()
+        db.close()
 
 
-async def run_update_job(job_id: str):
-    """Run update check job in background."""
-    job = _job_cache.get(job_id)
+def run_update_job(job_id: str):
+    """Run update check job on the update worker pool."""
+    job = _claim_job(job_id)
     if not job:
         return
 
+    db = open_db()
     job.status = JobStatus.RUNNING
     job.message = "Checking for updates..."
     job.add_log("Starting update check job", "info")
-    sync_job_to_db(job)
+    _mark_dirty(job)
 
     try:
-        from src.tracker import run_update_check
-
-        db = get_db()
-
         job.progress = 10
         job.message = "Fetching tool pages..."
         job.add_log("Fetching approved tool pages for changes...", "info")
-        sync_job_to_db(job)
+        _mark_dirty(job)
 
         result = run_update_check(db)
 
@@ -660,7 +927,7 @@ async def run_update_job(job_id: str):
         job.add_log(f"Checked {result['tools_checked']} tools", "info")
         job.add_log(f"Detected {result['changes_detected']} changes", "info")
         job.add_log("Job completed successfully", "success")
-        sync_job_to_db(job)
+        sync_job_to_db(job, db)
 
     except Exception as e:
         job.status = JobStatus.FAILED
@@ -668,170 +935,173 @@ async def run_update_job(job_id: str):
         job.message = f"Failed: {str(e)}"
         job.completed_at = datetime.now().isoformat()
         job.add_log(f"Job failed: {str(e)}", "error")
-        sync_job_to_db(job)
+        sync_job_to_db(job, db)
     finally:
-        _job_cache.pop(job_id, None)
+        _cache_remove(job_id)
+        # Reports read the tools, claims and changelog this job may have changed
+        invalidate_report_cache()
+        db.close()
+
+
+def schedule_update_job() -> Optional[Job]:
+    """Queue an update check unless one is already pending or running."""
+    if any(job.type == JobType.UPDATE for job in _active_jobs()):
+        return None
+    job = create_job(JobType.UPDATE)
+    job.add_log("Scheduled update check", "info")
+    worker.submit("update", job.id, run_update_job, job.id)
+    return job
+
+
+async def run_update_scheduler(interval_seconds: float) -> None:
+    """Queue an update check every interval until cancelled.
+
+    Ticks that find an update check still in flight are skipped rather
+    than queued behind it.
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            schedule_update_job()
+        except Exception as e:
+            print(f"Warning: Scheduled update check failed: {e}")
 
 
 @router.get("")
 async def list_jobs(
     limit: int = 20,
     status: Optional[str] = None,
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
+    db: Database = Depends(get_db),
 ):
-    """List recent jobs from database."""
-    db = get_db()
-    job_list = db.list_jobs(limit=limit, status=status)
-
-    # Merge with active cache jobs (in case db hasn't synced yet)
-    result = []
-    seen_ids = set()
-
-    # Add active jobs from cache first (most recent state)
-    for job in _job_cache.values():
-        result.append(job.model_dump())
-        seen_ids.add(job.id)
+    """List recent jobs, newest first."""
+    # Every job is in the database from creation, so it decides membership
+    # and order; active jobs are overlaid with their unflushed cached state.
+    jobs = []
+    for job_data in db.list_jobs(limit=limit, status=status):
+        job = _cache_get(job_data['id'])
+        if job is None:
+            jobs.append(job_data)
+        elif not status or job.status.value == status:
+            jobs.append(job.model_dump(mode="json"))
 
-    # Add database jobs not in cache
-    for job_data in job_list:
-        if job_data['id'] not in seen_ids:
-            result.append(job_data)
-
-    # Sort by started_at (descending), then by id for stability
-    # This ensures consistent ordering even when timestamps are identical
-    result.sort(key=lambda j: (j.get('started_at') or '', j.get('id', '')), reverse=True)
-
-    return {"jobs": result[:limit]}
+    # Already JSON-safe, so skip FastAPI's jsonable_encoder pass
+    return ORJSONResponse({"jobs": jobs})
 
 
 @router.get("/scout-types")
-async def get_scout_types(current_user: dict = Depends(get_current_user)):
+async def get_scout_types(response: Response, current_user: dict = Depends(get_current_user)):
     """Get available scout types with their descriptions."""
-    return {
-        "scout_types": [
-            {
-                "id": "reddit",
-                "name": "Reddit",
-                "description": "Scout Reddit for AI tool mentions",
-                "icon": "reddit",
-                "requires_api": True,
-            },
-            {
-                "id": "twitter",
-                "name": "Twitter/X",
-                "description": "Scout Twitter for AI tool mentions",
-                "icon": "twitter",
-                "requires_api": True,
-            },
-            {
-                "id": "producthunt",
-                "name": "Product Hunt",
-                "description": "Scout Product Hunt for new AI tool launches",
-                "icon": "producthunt",
-                "requires_api": True,
-            },
-            {
-                "id": "web",
-                "name": "Web Search",
-                "description": "Scout web search results for AI tools",
-                "icon": "search",
-                "requires_api": True,
-            },
-            {
-                "id": "rss",
-                "name": "RSS Feeds",
-                "description": "Scout RSS feeds for AI tool mentions",
-                "icon": "rss",
-                "requires_api": False,
-            },
-            {
-                "id": "all",
-                "name": "All Sources",
-                "description": "Run all scouts",
-                "icon": "globe",
-                "requires_api": True,
-            },
-        ]
-    }
+    # Static for the life of the process, so clients may cache it
+    response.headers["Cache-Control"] = "private, max-age=3600"
+    return SCOUT_TYPES_RESPONSE
 
 
 @router.get("/{job_id}")
-async def get_job(job_id: str, current_user: dict = Depends(get_current_user)):
+async def get_job(
+    job_id: str,
+    current_user: dict = Depends(get_current_user),
+    db: Database = Depends(get_db),
+):
     """Get job status."""
-    job = get_job_from_db(job_id)
+    job = get_job_from_db(job_id, db)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
-    return job.model_dump()
+    # Serialize straight to JSON in pydantic-core rather than via a dict
+    return Response(job.model_dump_json(), media_type="application/json")
 
 
 @router.post("/scout")
 async def start_scout(
     config: ScoutConfig,
-    background_tasks: BackgroundTasks,
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
+    db: Database = Depends(get_db),
 ):
     """Start a scout job."""
-    job = create_job(JobType.SCOUT, scout_type=config.scout_type.value, user_id=current_user.get('id'))
-    background_tasks.add_task(run_scout_job, job.id, config)
+    job = create_job(JobType.SCOUT, scout_type=config.scout_type.value,
+                     user_id=current_user.get('id'), db=db)
+    worker.submit("scout", job.id, run_scout_job, job.id, config)
     return {"job_id": job.id, "status": job.status, "scout_type": config.scout_type}
 
 
 @router.post("/analyze")
 async def start_analyze(
     config: AnalyzeConfig,
-    background_tasks: BackgroundTasks,
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
+    db: Database = Depends(get_db),
 ):
     """Start an analyzer job."""
-    job = create_job(JobType.ANALYZE, user_id=current_user.get('id'))
-    background_tasks.add_task(run_analyze_job, job.id, config)
+    job = create_job(JobType.ANALYZE, user_id=current_user.get('id'), db=db)
+    worker.submit("analyze", job.id, run_analyze_job, job.id, config)
     return {"job_id": job.id, "status": job.status}
 
 
 @router.post("/curate")
 async def start_curate(
     config: CurateConfig,
-    background_tasks: BackgroundTasks,
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
+    db: Database = Depends(get_db),
 ):
     """Start a curation job."""
-    job = create_job(JobType.CURATE)
-    background_tasks.add_task(run_curate_job, job.id, config)
+    job = create_job(JobType.CURATE, db=db)
+    worker.submit("curate", job.id, run_curate_job, job.id, config)
     return {"job_id": job.id, "status": job.status}
 
 
 @router.post("/update")
 async def start_update(
-    background_tasks: BackgroundTasks,
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
+    db: Database = Depends(get_db),
 ):
     """Start an update check job."""
-    job = create_job(JobType.UPDATE)
-    background_tasks.add_task(run_update_job, job.id)
+    job = create_job(JobType.UPDATE, db=db)
+    worker.submit("update", job.id, run_update_job, job.id)
     return {"job_id": job.id, "status": job.status}
 
 
 @router.delete("/{job_id}")
-async def cancel_job(job_id: str, current_user: dict = Depends(get_current_user)):
+async def cancel_job(
+    job_id: str,
+    current_user: dict = Depends(get_current_user),
+    db: Database = Depends(get_db),
+):
     """Cancel a running job."""
     # Check cache first for active jobs
-    job = _job_cache.get(job_id)
+    job = _cache_get(job_id)
     if job:
-        if job.status == JobStatus.RUNNING:
+        if job.status == JobStatus.PENDING and worker.cancel(job_id):
+            # Still queued - drop it before a worker picks it up
             job.status = JobStatus.CANCELLED
             job.message = "Cancelled by user"
             job.completed_at = datetime.now().isoformat()
-            sync_job_to_db(job)
-            _job_cache.pop(job_id, None)
+            sync_job_to_db(job, db)
+            _cache_remove(job_id)
+        elif job.status == JobStatus.RUNNING:
+            job.status = JobStatus.CANCELLED
+            job.message = "Cancelled by user"
+            job.completed_at = datetime.now().isoformat()
+            sync_job_to_db(job, db)
+            _cache_remove(job_id)
         return {"success": True, "status": job.status.value}
 
     # Check database
-    job = get_job_from_db(job_id)
+    job = get_job_from_db(job_id, db)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    if job.status == JobStatus.RUNNING:
-        db = get_db()
+    if job.status == JobStatus.PENDING and worker.cancel(job_id):
+        # Queued long enough to leave the cache but never started; drop any
+        # queued write-back so it cannot overwrite the cancellation
+        with _sync_lock:
+            _dirty.pop(job_id, None)
+            db.update_job(
+                job_id,
+                status="cancelled",
+                message="Cancelled by user",
+                completed=True
+            )
+        job.status = JobStatus.CANCELLED
+    elif job.status == JobStatus.RUNNING:
         db.update_job(
             job_id,
             status="cancelled",
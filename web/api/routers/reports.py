@@ -4,55 +4,152 @@ Reports Router
 Generate and retrieve reports.
 """
 
-from fastapi import APIRouter, Depends, Query
-from fastapi.responses import PlainTextResponse
+from datetime import datetime
+from typing import AsyncIterator, Callable, Iterable, Iterator
 
-from src.reporters import generate_changelog, generate_tools_index, generate_weekly_digest
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+
+from src.database import Database
+from src.reporters import (
+    generate_changelog,
+    generate_tools_index,
+    generate_weekly_digest,
+    iter_changelog,
+    iter_tools_index,
+    iter_weekly_digest,
+)
+from web.api.cache import TTLCache
 from web.api.deps import get_current_user, get_db
 
 router = APIRouter()
 
+# Rendered reports as (markdown, cached_at), keyed by report and parameters.
+# Cleared when jobs or reviews change the underlying data.
+_report_cache: TTLCache[tuple, tuple[str, str]] = TTLCache(maxsize=64, ttl=300)
+
+# Bumped on every invalidation. A report rendered across an invalidation may
+# hold stale data, so it is only cached if the generation is unchanged.
+_report_generation = 0
+
+
+def _get_report(key: tuple, generate: Callable[[], str]) -> tuple[str, str]:
+    """Get a rendered report from cache, generating it on a miss."""
+    cached = _report_cache.get(key)
+    if cached is None:
+        generation = _report_generation
+        cached = (generate(), datetime.now().isoformat())
+        if generation == _report_generation:
+            _report_cache[key] = cached
+    return cached
+
+
+def _chunk_lines(lines: Iterable[str], size: int = 100) -> Iterator[str]:
+    """Join report lines into newline-separated chunks of up to size lines."""
+    batch: list[str] = []
+    first = True
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= size:
+            yield ("" if first else "\n") + "\n".join(batch)
+            batch = []
+            first = False
+    if batch:
+        yield ("" if first else "\n") + "\n".join(batch)
+
+
+def _stream_report(key: tuple, lines: Iterator[str]) -> Response:
+    """Serve a raw report from cache, or stream it while rendering.
+
+    A streamed report is cached once fully sent, unless the cache was
+    invalidated while it was being rendered. The chunk generator is
+    async so rendering stays on the event loop thread that owns the
+    database connection.
+    """
+    cached = _report_cache.get(key)
+    if cached is not None:
+        return PlainTextResponse(cached[0])
+
+    generation = _report_generation
+
+    async def stream() -> AsyncIterator[str]:
+        chunks = []
+        for chunk in _chunk_lines(lines):
+            chunks.append(chunk)
+            yield chunk
+        if generation == _report_generation:
+            _report_cache[key] = ("".join(chunks), datetime.now().isoformat())
+
+    return StreamingResponse(stream(), media_type="text/plain; charset=utf-8")
+
+
+def invalidate_report_cache() -> None:
+    """Drop all cached reports after tools, claims or changelog change."""
+    global _report_generation
+    _report_generation += 1
+    _report_cache.clear()
+
 
 @router.get("/weekly")
-async def get_weekly_report(weeks: int = Query(1, ge=1, le=12), current_user: dict = Depends(get_current_user)):
+async def get_weekly_report(
+    weeks: int = Query(1, ge=1, le=12),
+    current_user: dict = Depends(get_current_user),
+    db: Database = Depends(get_db),
+):
     """Get weekly digest report."""
-    db = get_db()
-    report = generate_weekly_digest(db, weeks_back=weeks)
-    return {"report": report, "format": "markdown"}
+    report, cached_at = _get_report(
+        ("weekly", weeks), lambda: generate_weekly_digest(db, weeks_back=weeks)
+    )
+    return {"report": report, "format": "markdown", "cached_at": cached_at}
 
 
 @router.get("/weekly/raw", response_class=PlainTextResponse)
-async def get_weekly_report_raw(weeks: int = Query(1, ge=1, le=12), current_user: dict = Depends(get_current_user)):
+async def get_weekly_report_raw(
+    weeks: int = Query(1, ge=1, le=12),
+    current_user: dict = Depends(get_current_user),
+    db: Database = Depends(get_db),
+):
     """Get weekly digest as raw Markdown."""
-    db = get_db()
-    return generate_weekly_digest(db, weeks_back=weeks)
+    return _stream_report(("weekly", weeks), iter_weekly_digest(db, weeks_back=weeks))
 
 
 @router.get("/changelog")
-async def get_changelog_report(days: int = Query(7, ge=1, le=90), current_user: dict = Depends(get_current_user)):
+async def get_changelog_report(
+    days: int = Query(7, ge=1, le=90),
+    current_user: dict = Depends(get_current_user),
+    db: Database = Depends(get_db),
+):
     """Get changelog report."""
-    db = get_db()
-    report = generate_changelog(db, days=days)
-    return {"report": report, "format": "markdown"}
+    report, cached_at = _get_report(
+        ("changelog", days), lambda: generate_changelog(db, days=days)
+    )
+    return {"report": report, "format": "markdown", "cached_at": cached_at}
 
 
 @router.get("/changelog/raw", response_class=PlainTextResponse)
-async def get_changelog_report_raw(days: int = Query(7, ge=1, le=90), current_user: dict = Depends(get_current_user)):
+async def get_changelog_report_raw(
+    days: int = Query(7, ge=1, le=90),
+    current_user: dict = Depends(get_current_user),
+    db: Database = Depends(get_db),
+):
     """Get changelog as raw Markdown."""
-    db = get_db()
-    return generate_changelog(db, days=days)
+    return _stream_report(("changelog", days), iter_changelog(db, days=days))
 
 
 @router.get("/index")
-async def get_tools_index_report(current_user: dict = Depends(get_current_user)):
+async def get_tools_index_report(
+    current_user: dict = Depends(get_current_user),
+    db: Database = Depends(get_db),
+):
     """Get tools index report."""
-    db = get_db()
-    report = generate_tools_index(db)
-    return {"report": report, "format": "markdown"}
+    report, cached_at = _get_report(("index",), lambda: generate_tools_index(db))
+    return {"report": report, "format": "markdown", "cached_at": cached_at}
 
 
 @router.get("/index/raw", response_class=PlainTextResponse)
-async def get_tools_index_raw(current_user: dict = Depends(get_current_user)):
+async def get_tools_index_raw(
+    current_user: dict = Depends(get_current_user),
+    db: Database = Depends(get_db),
+):
     """Get tools index as raw Markdown."""
-    db = get_db()
-    return generate_tools_index(db)
+    return _stream_report(("index",), iter_tools_index(db))
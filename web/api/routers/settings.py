@@ -4,15 +4,27 @@ Settings Router
 Endpoints for managing user settings and API credentials.
 """
 
-from typing import Optional
+import asyncio
+import hashlib
+import time
+from typing import Any, Literal, Optional
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
+import orjson
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from pydantic import BaseModel, ConfigDict
+from starlette.concurrency import run_in_threadpool
 
 from src.database import Database
+from web.api.cache import TTLCache
 from web.api.deps import get_current_user, get_db
 
+try:
+    import openai
+    HAS_OPENAI = True
+except ImportError:
+    HAS_OPENAI = False
+
 router = APIRouter()
 
 
@@ -139,6 +151,9 @@ SERVICE_GROUPS = {
     },
 }
 
+# Path/body type for service IDs; must list exactly the SERVICE_GROUPS keys
+ServiceId = Literal["anthropic", "openai", "reddit", "twitter", "producthunt", "websearch"]
+
 # Predefined setting schemas for validation and documentation
 # (Legacy format for backwards compatibility)
 API_KEY_SETTINGS = {
@@ -245,63 +260,154 @@ ANALYZER_SETTINGS = {
     },
 }
 
+# Path/body type for setting categories; must list exactly the _SCHEMAS keys
+Category = Literal["api_keys", "scouts", "analyzers"]
+
+# Setting schemas by category
+_SCHEMAS = {
+    "api_keys": API_KEY_SETTINGS,
+    "scouts": SCOUT_SETTINGS,
+    "analyzers": ANALYZER_SETTINGS,
+}
+_META_BY_CATKEY = {
+    (category, key): meta
+    for category, schema in _SCHEMAS.items()
+    for key, meta in schema.items()
+}
+_VALID_KEYS = frozenset(_META_BY_CATKEY)
+
+# Static metadata of every defined setting, serialized once as the inside of
+# a JSON object; responses only encode the per-user value fields
+_META_JSON = {
+    category: {
+        key: (orjson.dumps(key), orjson.dumps(meta)[1:-1])
+        for key, meta in schema.items()
+    }
+    for category, schema in _SCHEMAS.items()
+}
+
+# /schema body and validator, fixed for the life of the process
+_SCHEMA_JSON = orjson.dumps(_SCHEMAS)
+_SCHEMA_ETAG = f'"{hashlib.sha256(_SCHEMA_JSON).hexdigest()[:16]}"'
+_SCHEMA_HEADERS = {"ETag": _SCHEMA_ETAG, "Cache-Control": "private, max-age=3600"}
+
 
 class SettingUpdate(BaseModel):
     """Request to update a setting."""
+    model_config = ConfigDict(extra="forbid", str_max_length=8192)
+
     value: str
     is_secret: bool = False
 
 
-class SettingResponse(BaseModel):
-    """Response for a single setting."""
-    category: str
+class BulkSettingItem(BaseModel):
+    """One setting in a bulk update."""
+    model_config = ConfigDict(extra="forbid", str_max_length=8192)
+
+    category: Category
     key: str
-    value: Optional[str]
-    is_secret: bool
-    label: str
-    description: str
-    placeholder: Optional[str] = None
-    default: Optional[str] = None
-    options: Optional[list[str]] = None
+    value: str
+    is_secret: bool = False
+
+
+class BulkSettingUpdate(BaseModel):
+    """Request to update several settings at once."""
+    updates: list[BulkSettingItem]
+
+
+class ServiceTestRequest(BaseModel):
+    """Request to test several services at once."""
+    service_ids: list[ServiceId]
 
 
-class SettingsSchemaResponse(BaseModel):
-    """Response containing available settings schema."""
-    api_keys: dict
-    scouts: dict
-    analyzers: dict
+# Bullets for the masked middle of secrets, sliced to length. Covers the
+# 8192-character limit on setting values.
+_BULLETS = "•" * 8192
 
 
 def mask_secret(value: str) -> str:
     """Mask a secret value for display."""
     if not value or len(value) < 8:
-        return "••••••••"
-    return value[:4] + "•" * (len(value) - 8) + value[-4:]
+        return _BULLETS[:8]
+    return f"{value[:4]}{_BULLETS[:len(value) - 8]}{value[-4:]}"
 
 
 def get_setting_metadata(category: str, key: str) -> dict:
     """Get metadata for a setting."""
-    schemas = {
-        "api_keys": API_KEY_SETTINGS,
-        "scouts": SCOUT_SETTINGS,
-        "analyzers": ANALYZER_SETTINGS,
-    }
-    category_schema = schemas.get(category, {})
-    return category_schema.get(key, {
-        "label": key.replace("_", " ").title(),
-        "description": "",
-        "placeholder": "",
-    })
+    meta = _META_BY_CATKEY.get((category, key))
+    if meta is None:
+        return {
+            "label": key.replace("_", " ").title(),
+            "description": "",
+            "placeholder": "",
+        }
+    return meta
+
+
+# Stored settings per user, as returned by Database.get_all_settings. Writes
+# through this router drop the user's entry; changes made elsewhere (e.g.
+# the CLI) show up once it expires.
+_settings_cache: TTLCache[int, dict] = TTLCache(maxsize=1024, ttl=60)
+
+# Serialized GET /services bodies per user, dropped along with the settings
+_services_cache: TTLCache[int, bytes] = TTLCache(maxsize=1024, ttl=60)
 
 
+def _get_user_settings(db: Database, user_id: int) -> dict:
+    """Get a user's stored settings grouped by category, from cache if fresh.
+
+    The returned dict is shared with the cache and must not be modified.
+    """
+    settings = _settings_cache.get(user_id)
+    if settings is None:
+        settings = db.get_all_settings(user_id)
+        _settings_cache[user_id] = settings
+    return settings
+
+
+def _invalidate_user_settings(user_id: int) -> None:
+    """Drop a user's cached settings after a write."""
+    _settings_cache.pop(user_id, None)
+    _services_cache.pop(user_id, None)
+
+
+def _category_settings_json(category: str, stored: dict) -> bytes:
+    """Serialize every defined setting in a category as a JSON object.
+
+    Unset settings are included with value None; secret values are masked.
+    """
+    default_secret = category == "api_keys"  # API keys are secret by default
+    entries = []
+    for key, (key_json, meta_json) in _META_JSON[category].items():
+        setting = stored.get(key)
+        if setting:
+            value = setting["value"]
+            is_secret = setting["is_secret"]
+            fields = {
+                "value": mask_secret(value) if is_secret else value,
+                "is_set": value is not None,
+                "is_secret": is_secret,
+            }
+        else:
+            fields = {"value": None, "is_set": False, "is_secret": default_secret}
+        entries.append(b"%s:%s,%s}" % (key_json, orjson.dumps(fields)[:-1], meta_json))
+    return b"{" + b",".join(entries) + b"}"
+
+
+# Handlers here stay `async def` even though none of them await the
+# database. FastAPI runs plain `def` handlers in its threadpool, and the
+# shared connection from get_db() is bound to the event loop thread. The
+# schema handler only returns precomputed bytes, so running it inline is
+# cheaper than a thread hop.
 @router.get("/schema")
-async def get_settings_schema(current_user: dict = Depends(get_current_user)):
+async def get_settings_schema(
+    if_none_match: Optional[str] = Header(None),
+    current_user: dict = Depends(get_current_user),
+):
     """Get the schema of all available settings."""
-    return {
-        "api_keys": API_KEY_SETTINGS,
-        "scouts": SCOUT_SETTINGS,
-        "analyzers": ANALYZER_SETTINGS,
-    }
+    if if_none_match == _SCHEMA_ETAG:
+        return Response(status_code=304, headers=_SCHEMA_HEADERS)
+    return Response(_SCHEMA_JSON, media_type="application/json", headers=_SCHEMA_HEADERS)
 
 
 @router.get("")
@@ -310,43 +416,37 @@ async def get_all_settings(
     db: Database = Depends(get_db),
 ):
     """Get all settings for the current user."""
-    settings = db.get_all_settings(current_user["id"])
+    settings = _get_user_settings(db, current_user["id"])
 
     # Build response with metadata and masked secrets
-    result = {}
-    for category in ["api_keys", "scouts", "analyzers"]:
-        result[category] = {}
-        cat_settings = settings.get(category, {})
-
-        # Get schema for this category
-        schemas = {
-            "api_keys": API_KEY_SETTINGS,
-            "scouts": SCOUT_SETTINGS,
-            "analyzers": ANALYZER_SETTINGS,
-        }
-        schema = schemas.get(category, {})
-
-        # Include all defined settings, even if not set
-        for key, meta in schema.items():
-            setting = cat_settings.get(key)
-            if setting:
-                value = setting["value"]
-                is_secret = setting["is_secret"]
-                # Mask secret values
-                display_value = mask_secret(value) if is_secret else value
-            else:
-                value = None
-                is_secret = category == "api_keys"  # API keys are secret by default
-                display_value = None
-
-            result[category][key] = {
-                "value": display_value,
-                "is_set": value is not None,
-                "is_secret": is_secret,
-                **meta,
-            }
+    body = b",".join(
+        b'"%s":%s' % (category.encode(), _category_settings_json(category, settings.get(category, {})))
+        for category in _SCHEMAS
+    )
+    return Response(b"{" + body + b"}", media_type="application/json")
+
+
+@router.put("")
+async def update_settings_bulk(
+    bulk: BulkSettingUpdate,
+    current_user: dict = Depends(get_current_user),
+    db: Database = Depends(get_db),
+):
+    """Update several settings in one write, e.g. when saving a whole form."""
+    rows = []
+    for update in bulk.updates:
+        if (update.category, update.key) not in _VALID_KEYS:
+            raise HTTPException(
+                status_code=400, detail=f"Invalid setting: {update.category}/{update.key}"
+            )
+        # API keys are always secret
+        is_secret = update.is_secret or update.category == "api_keys"
+        rows.append((update.category, update.key, update.value, is_secret))
 
-    return result
+    db.set_settings_bulk(current_user["id"], rows)
+    _invalidate_user_settings(current_user["id"])
+
+    return {"success": True, "updated": len(rows)}
 
 
 # ============================================================================
@@ -373,6 +473,57 @@ def _get_service_setting_key(service_id: str, field_key: str,
     return f"{service_id}_{field_key}"
 
 
+def _build_service_setting_keys() -> dict[tuple[str, str, Optional[str]], str]:
+    """Map every defined (service, field, provider) to its setting key."""
+    keys = {}
+    for service_id, service_def in SERVICE_GROUPS.items():
+        for field in service_def.get("fields", []):
+            key = _get_service_setting_key(service_id, field["key"])
+            keys[(service_id, field["key"], None)] = key
+        for provider_id, provider_def in service_def.get("providers", {}).items():
+            for field in provider_def["fields"]:
+                key = _get_service_setting_key(service_id, field["key"], provider_id)
+                keys[(service_id, field["key"], provider_id)] = key
+    return keys
+
+
+_SERVICE_SETTING_KEYS = _build_service_setting_keys()
+
+
+def _build_required_setting_keys() -> dict[tuple[str, Optional[str]], tuple[str, ...]]:
+    """Map every (service, provider) to the setting keys it requires."""
+    required = {}
+    for service_id, service_def in SERVICE_GROUPS.items():
+        for provider_id, provider_def in service_def.get("providers", {}).items():
+            required[(service_id, provider_id)] = tuple(
+                _SERVICE_SETTING_KEYS[(service_id, field["key"], provider_id)]
+                for field in provider_def["fields"] if field.get("required")
+            )
+        if not service_def.get("has_provider_choice"):
+            required[(service_id, None)] = tuple(
+                _SERVICE_SETTING_KEYS[(service_id, field["key"], None)]
+                for field in service_def.get("fields", []) if field.get("required")
+            )
+    return required
+
+
+_REQUIRED_SETTING_KEYS = _build_required_setting_keys()
+
+
+def _get_api_keys(db: Database, user_id: int,
+                  cached: bool = False) -> dict[str, Optional[str]]:
+    """Get all of a user's api_keys settings as {key: value} in one query.
+
+    Endpoints that only display settings may pass cached=True to read
+    through the per-user settings cache instead.
+    """
+    if cached:
+        settings = _get_user_settings(db, user_id).get("api_keys", {})
+    else:
+        settings = db.get_settings_by_category(user_id, "api_keys")
+    return {key: setting["value"] for key, setting in settings.items()}
+
+
 def is_service_configured(db, user_id: int, service_id: str) -> bool:
     """Check if all required credentials are configured for a service.
 
@@ -387,27 +538,15 @@ def is_service_configured(db, user_id: int, service_id: str) -> bool:
     if service_id not in SERVICE_GROUPS:
         return False
 
-    service_def = SERVICE_GROUPS[service_id]
+    api_keys = _get_api_keys(db, user_id)
 
-    # Handle provider-based services (websearch)
-    if service_def.get("has_provider_choice"):
-        selected_provider = (
-            db.get_setting(user_id, "api_keys", "websearch_provider") or "serpapi"
-        )
-        provider_def = service_def["providers"].get(selected_provider, {})
-        fields = provider_def.get("fields", [])
-        for field in fields:
-            key = f"websearch_{selected_provider}_{field['key']}"
-            if field.get("required") and not db.get_setting(user_id, "api_keys", key):
-                return False
-        return True
-
-    # Handle simple services
-    for field in service_def.get("fields", []):
-        key = _get_service_setting_key(service_id, field["key"])
-        if field.get("required") and not db.get_setting(user_id, "api_keys", key):
-            return False
-    return True
+    # Provider-based services (websearch) check the selected provider's fields
+    provider_id = None
+    if SERVICE_GROUPS[service_id].get("has_provider_choice"):
+        provider_id = api_keys.get(f"{service_id}_provider") or "serpapi"
+
+    required = _REQUIRED_SETTING_KEYS.get((service_id, provider_id), ())
+    return all(api_keys.get(key) for key in required)
 
 
 def _build_service_field(field_def: dict, value: Optional[str],
@@ -423,88 +562,92 @@ def _build_service_field(field_def: dict, value: Optional[str],
     }
 
 
+def _build_service_fields(service_id: str, field_defs: list[dict],
+                          provider_id: Optional[str],
+                          api_keys: dict[str, Optional[str]]) -> tuple[list[dict], bool]:
+    """Build a service's field responses and whether its required fields are set."""
+    fields = []
+    is_configured = True
+    for field_def in field_defs:
+        value = api_keys.get(_SERVICE_SETTING_KEYS[(service_id, field_def["key"], provider_id)])
+        is_set = value is not None
+        if field_def.get("required") and not is_set:
+            is_configured = False
+        fields.append(_build_service_field(field_def, value, is_set))
+    return fields, is_configured
+
+
+def _build_simple_service(service_id: str, service_def: dict,
+                          api_keys: dict[str, Optional[str]]) -> dict:
+    """Build the response for a service with a single set of fields."""
+    fields, is_configured = _build_service_fields(
+        service_id, service_def.get("fields", []), None, api_keys
+    )
+    return {
+        "id": service_id,
+        "name": service_def["name"],
+        "description": service_def["description"],
+        "fields": fields,
+        "is_configured": is_configured,
+    }
+
+
+def _build_provider_service(service_id: str, service_def: dict,
+                            api_keys: dict[str, Optional[str]]) -> dict:
+    """Build the response for a service with a choice of providers (websearch)."""
+    selected_provider = api_keys.get(f"{service_id}_provider") or "serpapi"
+    providers = []
+    is_configured = False
+    for provider_id, provider_def in service_def["providers"].items():
+        fields, provider_configured = _build_service_fields(
+            service_id, provider_def["fields"], provider_id, api_keys
+        )
+        providers.append({
+            "id": provider_id,
+            "name": provider_def["name"],
+            "fields": fields,
+            "is_configured": provider_configured,
+        })
+        # Service is configured if the selected provider is configured
+        if provider_id == selected_provider:
+            is_configured = provider_configured
+    return {
+        "id": service_id,
+        "name": service_def["name"],
+        "description": service_def["description"],
+        "has_provider_choice": True,
+        "selected_provider": selected_provider,
+        "providers": providers,
+        "is_configured": is_configured,
+    }
+
+
 @router.get("/services")
 async def get_services(
     current_user: dict = Depends(get_current_user),
     db: Database = Depends(get_db),
 ):
     """Get all services with their configuration status."""
-    user_id = current_user["id"]
-    services = []
-
-    for service_id, service_def in SERVICE_GROUPS.items():
-        service = {
-            "id": service_id,
-            "name": service_def["name"],
-            "description": service_def["description"],
-        }
-
-        if service_def.get("has_provider_choice"):
-            # Handle provider-based services (like websearch)
-            service["has_provider_choice"] = True
-            selected_provider = db.get_setting(
-                user_id, "api_keys", "websearch_provider"
-            ) or "serpapi"
-            service["selected_provider"] = selected_provider
-
-            providers = []
-            for provider_id, provider_def in service_def["providers"].items():
-                provider_fields = []
-                provider_configured = True
-
-                for field_def in provider_def["fields"]:
-                    setting_key = _get_service_setting_key(
-                        service_id, field_def["key"], provider_id
-                    )
-                    value = db.get_setting(user_id, "api_keys", setting_key)
-                    is_set = value is not None
-
-                    if field_def.get("required") and not is_set:
-                        provider_configured = False
-
-                    provider_fields.append(
-                        _build_service_field(field_def, value, is_set)
-                    )
-
-                providers.append({
-                    "id": provider_id,
-                    "name": provider_def["name"],
-                    "fields": provider_fields,
-                    "is_configured": provider_configured,
-                })
-
-            service["providers"] = providers
-            # Service is configured if the selected provider is configured
-            selected = next(
-                (p for p in providers if p["id"] == selected_provider), None
-            )
-            service["is_configured"] = selected["is_configured"] if selected else False
-        else:
-            # Handle simple services
-            fields = []
-            is_configured = True
-
-            for field_def in service_def.get("fields", []):
-                setting_key = _get_service_setting_key(service_id, field_def["key"])
-                value = db.get_setting(user_id, "api_keys", setting_key)
-                is_set = value is not None
+    body = _services_cache.get(current_user["id"])
+    if body is not None:
+        return Response(body, media_type="application/json")
 
-                if field_def.get("required") and not is_set:
-                    is_configured = False
+    api_keys = _get_api_keys(db, current_user["id"], cached=True)
+    services = [
+        _build_provider_service(service_id, service_def, api_keys)
+        if service_def.get("has_provider_choice")
+        else _build_simple_service(service_id, service_def, api_keys)
+        for service_id, service_def in SERVICE_GROUPS.items()
+    ]
 
-                fields.append(_build_service_field(field_def, value, is_set))
-
-            service["fields"] = fields
-            service["is_configured"] = is_configured
-
-        services.append(service)
-
-    return {"services": services}
+    body = orjson.dumps({"services": services})
+    _services_cache[current_user["id"]] = body
+    return Response(body, media_type="application/json")
 
 
 @router.put("/services/{service_id}/field")
 async def update_service_field(
-    service_id: str,
+    service_id: ServiceId,
     field_key: str,
     value: str,
     provider_id: Optional[str] = None,
@@ -512,10 +655,9 @@ async def update_service_field(
     db: Database = Depends(get_db),
 ):
     """Update a service field value."""
-    if service_id not in SERVICE_GROUPS:
-        raise HTTPException(status_code=400, detail=f"Invalid service: {service_id}")
-
-    setting_key = _get_service_setting_key(service_id, field_key, provider_id)
+    setting_key = _SERVICE_SETTING_KEYS.get((service_id, field_key, provider_id))
+    if setting_key is None:
+        setting_key = _get_service_setting_key(service_id, field_key, provider_id)
 
     db.set_setting(
         user_id=current_user["id"],
@@ -524,21 +666,19 @@ async def update_service_field(
         value=value,
         is_secret=True,
     )
+    _invalidate_user_settings(current_user["id"])
 
     return {"success": True, "key": setting_key}
 
 
 @router.put("/services/{service_id}/provider")
 async def set_service_provider(
-    service_id: str,
+    service_id: ServiceId,
     provider_id: str,
     current_user: dict = Depends(get_current_user),
     db: Database = Depends(get_db),
 ):
     """Set the active provider for a service."""
-    if service_id not in SERVICE_GROUPS:
-        raise HTTPException(status_code=400, detail=f"Invalid service: {service_id}")
-
     service_def = SERVICE_GROUPS[service_id]
     if not service_def.get("has_provider_choice"):
         raise HTTPException(
@@ -555,59 +695,116 @@ async def set_service_provider(
         value=provider_id,
         is_secret=False,
     )
+    _invalidate_user_settings(current_user["id"])
 
     return {"success": True, "provider": provider_id}
 
 
+# OpenAI SDK clients by API key, so repeat tests reuse their HTTP
+# connection pools. Evicted clients may still be mid-request on another
+# thread, so they are left to garbage collection; the rest are closed on
+# shutdown.
+_openai_clients: TTLCache[str, Any] = TTLCache(maxsize=32, ttl=3600)
+
+
+def _get_openai_client(api_key: str) -> Any:
+    """Get a cached OpenAI client for an API key."""
+    client = _openai_clients.get(api_key)
+    if client is None:
+        # A key check should report failures, not retry through them
+        client = openai.OpenAI(api_key=api_key, max_retries=0)
+        _openai_clients[api_key] = client
+    return client
+
+
 async def _test_anthropic(api_key: str) -> dict:
     """Test Anthropic API key."""
     try:
-        import anthropic
-        client = anthropic.Anthropic(api_key=api_key)
-        client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=10,
-            messages=[{"role": "user", "content": "Hi"}],
+        # Listing models authenticates the key without paying for a completion
+        client = _get_http_client()
+        response = await client.get(
+            "https://api.anthropic.com/v1/models",
+            headers={"x-api-key": api_key, "anthropic-version": "2023-06-01"},
+            params={"limit": 1},
+            timeout=10,
         )
-        return {"success": True, "message": "Anthropic API key is valid"}
-    except anthropic.AuthenticationError:
-        return {"success": False, "message": "Invalid API key"}
+        if response.status_code == 200:
+            return {"success": True, "message": "Anthropic API key is valid"}
+        elif response.status_code == 401:
+            return {"success": False, "message": "Invalid API key"}
+        else:
+            return {
+                "success": False,
+                "message": f"Anthropic API error: {response.status_code}"
+            }
     except Exception as e:
         return {"success": False, "message": f"Error: {str(e)}"}
 
 
 async def _test_openai(api_key: str) -> dict:
     """Test OpenAI API key."""
+    if not HAS_OPENAI:
+        return {
+            "success": False,
+            "message": "openai package required. Install with: pip install openai"
+        }
     try:
-        import openai
-        client = openai.OpenAI(api_key=api_key)
-        client.models.list()
+        client = _get_openai_client(api_key)
+        # The SDK client is synchronous; keep the event loop free meanwhile
+        await run_in_threadpool(client.models.list)
         return {"success": True, "message": "OpenAI API key is valid"}
     except Exception as e:
         return {"success": False, "message": f"Error: {str(e)}"}
 
 
+# Shared client for credential checks, so repeat tests reuse pooled
+# connections instead of paying a new TCP and TLS handshake each time
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=10,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and cached OpenAI clients on shutdown."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+    for client in _openai_clients.values():
+        client.close()
+    _openai_clients.clear()
+
+
 async def _test_reddit(client_id: str, client_secret: str,
                        username: str, password: str) -> dict:
     """Test Reddit OAuth credentials."""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://www.reddit.com/api/v1/access_token",
-                auth=(client_id, client_secret),
-                data={
-                    "grant_type": "password",
-                    "username": username,
-                    "password": password,
-                },
-                headers={"User-Agent": "Glean/1.0"},
-                timeout=10,
-            )
-            if response.status_code == 200 and response.json().get("access_token"):
-                return {"success": True, "message": "Reddit credentials are valid"}
-            else:
-                error = response.json().get("error", "Unknown error")
-                return {"success": False, "message": f"Invalid credentials: {error}"}
+        client = _get_http_client()
+        response = await client.post(
+            "https://www.reddit.com/api/v1/access_token",
+            auth=(client_id, client_secret),
+            data={
+                "grant_type": "password",
+                "username": username,
+                "password": password,
+            },
+            headers={"User-Agent": "Glean/1.0"},
+            timeout=10,
+        )
+        if response.status_code == 200 and response.json().get("access_token"):
+            return {"success": True, "message": "Reddit credentials are valid"}
+        else:
+            error = response.json().get("error", "Unknown error")
+            return {"success": False, "message": f"Invalid credentials: {error}"}
     except Exception as e:
         return {"success": False, "message": f"Error: {str(e)}"}
 
@@ -615,21 +812,21 @@ async def _test_reddit(client_id: str, client_secret: str,
 async def _test_twitter(bearer_token: str) -> dict:
     """Test Twitter bearer token."""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://api.twitter.com/2/users/me",
-                headers={"Authorization": f"Bearer {bearer_token}"},
-                timeout=10,
-            )
-            if response.status_code == 200:
-                return {"success": True, "message": "Twitter bearer token is valid"}
-            elif response.status_code == 401:
-                return {"success": False, "message": "Invalid bearer token"}
-            else:
-                return {
-                    "success": False,
-                    "message": f"Twitter API error: {response.status_code}"
-                }
+        client = _get_http_client()
+        response = await client.get(
+            "https://api.twitter.com/2/users/me",
+            headers={"Authorization": f"Bearer {bearer_token}"},
+            timeout=10,
+        )
+        if response.status_code == 200:
+            return {"success": True, "message": "Twitter bearer token is valid"}
+        elif response.status_code == 401:
+            return {"success": False, "message": "Invalid bearer token"}
+        else:
+            return {
+                "success": False,
+                "message": f"Twitter API error: {response.status_code}"
+            }
     except Exception as e:
         return {"success": False, "message": f"Error: {str(e)}"}
 
@@ -637,21 +834,21 @@ async def _test_twitter(bearer_token: str) -> dict:
 async def _test_producthunt(api_key: str, api_secret: str) -> dict:
     """Test Product Hunt OAuth credentials."""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.producthunt.com/v2/oauth/token",
-                json={
-                    "client_id": api_key,
-                    "client_secret": api_secret,
-                    "grant_type": "client_credentials",
-                },
-                timeout=10,
-            )
-            if response.status_code == 200 and response.json().get("access_token"):
-                return {"success": True, "message": "Product Hunt credentials are valid"}
-            else:
-                error = response.json().get("error", "Unknown error")
-                return {"success": False, "message": f"Invalid credentials: {error}"}
+        client = _get_http_client()
+        response = await client.post(
+            "https://api.producthunt.com/v2/oauth/token",
+            json={
+                "client_id": api_key,
+                "client_secret": api_secret,
+                "grant_type": "client_credentials",
+            },
+            timeout=10,
+        )
+        if response.status_code == 200 and response.json().get("access_token"):
+            return {"success": True, "message": "Product Hunt credentials are valid"}
+        else:
+            error = response.json().get("error", "Unknown error")
+            return {"success": False, "message": f"Invalid credentials: {error}"}
     except Exception as e:
         return {"success": False, "message": f"Error: {str(e)}"}
 
@@ -659,16 +856,16 @@ async def _test_producthunt(api_key: str, api_secret: str) -> dict:
 async def _test_serpapi(api_key: str) -> dict:
     """Test SerpAPI key."""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://serpapi.com/account",
-                params={"api_key": api_key},
-                timeout=10,
-            )
-            if response.status_code == 200:
-                return {"success": True, "message": "SerpAPI key is valid"}
-            else:
-                return {"success": False, "message": "Invalid SerpAPI key"}
+        client = _get_http_client()
+        response = await client.get(
+            "https://serpapi.com/account",
+            params={"api_key": api_key},
+            timeout=10,
+        )
+        if response.status_code == 200:
+            return {"success": True, "message": "SerpAPI key is valid"}
+        else:
+            return {"success": False, "message": "Invalid SerpAPI key"}
     except Exception as e:
         return {"success": False, "message": f"Error: {str(e)}"}
 
@@ -676,93 +873,144 @@ async def _test_serpapi(api_key: str) -> dict:
 async def _test_google_cse(api_key: str, cx: str) -> dict:
     """Test Google Custom Search credentials."""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://www.googleapis.com/customsearch/v1",
-                params={
-                    "key": api_key,
-                    "cx": cx,
-                    "q": "test",
-                    "num": 1,
-                },
-                timeout=10,
-            )
-            if response.status_code == 200:
-                return {"success": True, "message": "Google CSE credentials are valid"}
-            elif response.status_code == 400:
-                error = response.json().get("error", {}).get("message", "Invalid request")
-                return {"success": False, "message": f"Invalid credentials: {error}"}
-            elif response.status_code == 403:
-                return {"success": False, "message": "API key invalid or quota exceeded"}
-            else:
-                return {
-                    "success": False,
-                    "message": f"Google API error: {response.status_code}"
-                }
+        client = _get_http_client()
+        response = await client.get(
+            "https://www.googleapis.com/customsearch/v1",
+            params={
+                "key": api_key,
+                "cx": cx,
+                "q": "test",
+                "num": 1,
+            },
+            timeout=10,
+        )
+        if response.status_code == 200:
+            return {"success": True, "message": "Google CSE credentials are valid"}
+        elif response.status_code == 400:
+            error = response.json().get("error", {}).get("message", "Invalid request")
+            return {"success": False, "message": f"Invalid credentials: {error}"}
+        elif response.status_code == 403:
+            return {"success": False, "message": "API key invalid or quota exceeded"}
+        else:
+            return {
+                "success": False,
+                "message": f"Google API error: {response.status_code}"
+            }
     except Exception as e:
         return {"success": False, "message": f"Error: {str(e)}"}
 
 
+# Credential tests allowed per user and service within a sliding window,
+# so a runaway client cannot hammer upstream APIs from this server
+TEST_RATE_LIMIT = 5
+TEST_RATE_WINDOW_SECONDS = 60
+
+_test_attempts: TTLCache[tuple[int, str], list[float]] = TTLCache(
+    maxsize=4096, ttl=TEST_RATE_WINDOW_SECONDS
+)
+
+
+def _check_test_rate_limit(user_id: int, target: str) -> None:
+    """Record a credential test, raising 429 if the user is over the limit."""
+    now = time.monotonic()
+    attempts = [
+        t for t in _test_attempts.get((user_id, target), ())
+        if now - t < TEST_RATE_WINDOW_SECONDS
+    ]
+    if len(attempts) >= TEST_RATE_LIMIT:
+        retry_after = int(TEST_RATE_WINDOW_SECONDS - (now - attempts[0])) + 1
+        raise HTTPException(
+            status_code=429,
+            detail=f"Too many tests for {target}; try again later",
+            headers={"Retry-After": str(retry_after)},
+        )
+    attempts.append(now)
+    _test_attempts[(user_id, target)] = attempts
+
+
 @router.post("/test-service/{service_id}")
 async def test_service(
-    service_id: str,
+    service_id: ServiceId,
     current_user: dict = Depends(get_current_user),
     db: Database = Depends(get_db),
 ):
     """Test all credentials for a service."""
-    if service_id not in SERVICE_GROUPS:
-        raise HTTPException(status_code=400, detail=f"Invalid service: {service_id}")
+    _check_test_rate_limit(current_user["id"], service_id)
+
+    return await _test_service_credentials(
+        service_id, _get_api_keys(db, current_user["id"])
+    )
 
-    user_id = current_user["id"]
 
+@router.post("/test-services")
+async def test_services(
+    request: ServiceTestRequest,
+    current_user: dict = Depends(get_current_user),
+    db: Database = Depends(get_db),
+):
+    """Test the credentials of several services concurrently."""
+    for service_id in set(request.service_ids):
+        _check_test_rate_limit(current_user["id"], service_id)
+
+    api_keys = _get_api_keys(db, current_user["id"])
+    results = await asyncio.gather(*(
+        _test_service_credentials(service_id, api_keys)
+        for service_id in request.service_ids
+    ))
+    return {"results": dict(zip(request.service_ids, results))}
+
+
+async def _test_service_credentials(service_id: str,
+                                    api_keys: dict[str, Optional[str]]) -> dict:
+    """Test a service's stored credentials against its API."""
     if service_id == "anthropic":
-        api_key = db.get_setting(user_id, "api_keys", "anthropic")
+        api_key = api_keys.get("anthropic")
         if not api_key:
             return {"success": False, "message": "API key not configured"}
         return await _test_anthropic(api_key)
 
     elif service_id == "openai":
-        api_key = db.get_setting(user_id, "api_keys", "openai")
+        api_key = api_keys.get("openai")
         if not api_key:
             return {"success": False, "message": "API key not configured"}
         return await _test_openai(api_key)
 
     elif service_id == "reddit":
-        client_id = db.get_setting(user_id, "api_keys", "reddit_client_id")
-        client_secret = db.get_setting(user_id, "api_keys", "reddit_client_secret")
-        username = db.get_setting(user_id, "api_keys", "reddit_username")
-        password = db.get_setting(user_id, "api_keys", "reddit_password")
+        client_id = api_keys.get("reddit_client_id")
+        client_secret = api_keys.get("reddit_client_secret")
+        username = api_keys.get("reddit_username")
+        password = api_keys.get("reddit_password")
 
         if not all([client_id, client_secret, username, password]):
             return {"success": False, "message": "All Reddit credentials must be configured"}
         return await _test_reddit(client_id, client_secret, username, password)
 
     elif service_id == "twitter":
-        bearer_token = db.get_setting(user_id, "api_keys", "twitter_bearer_token")
+        bearer_token = api_keys.get("twitter_bearer_token")
         if not bearer_token:
             return {"success": False, "message": "Bearer token not configured"}
         return await _test_twitter(bearer_token)
 
     elif service_id == "producthunt":
-        api_key = db.get_setting(user_id, "api_keys", "producthunt_api_key")
-        api_secret = db.get_setting(user_id, "api_keys", "producthunt_api_secret")
+        api_key = api_keys.get("producthunt_api_key")
+        api_secret = api_keys.get("producthunt_api_secret")
 
         if not api_key or not api_secret:
             return {"success": False, "message": "Both API key and secret must be configured"}
         return await _test_producthunt(api_key, api_secret)
 
     elif service_id == "websearch":
-        provider = db.get_setting(user_id, "api_keys", "websearch_provider") or "serpapi"
+        provider = api_keys.get("websearch_provider") or "serpapi"
 
         if provider == "serpapi":
-            api_key = db.get_setting(user_id, "api_keys", "websearch_serpapi_api_key")
+            api_key = api_keys.get("websearch_serpapi_api_key")
             if not api_key:
                 return {"success": False, "message": "SerpAPI key not configured"}
             return await _test_serpapi(api_key)
 
         elif provider == "google":
-            api_key = db.get_setting(user_id, "api_keys", "websearch_google_api_key")
-            cx = db.get_setting(user_id, "api_keys", "websearch_google_cx")
+            api_key = api_keys.get("websearch_google_api_key")
+            cx = api_keys.get("websearch_google_cx")
             if not api_key or not cx:
                 return {
                     "success": False,
@@ -782,65 +1030,26 @@ async def test_service(
 
 @router.get("/{category}")
 async def get_category_settings(
-    category: str,
+    category: Category,
     current_user: dict = Depends(get_current_user),
     db: Database = Depends(get_db),
 ):
     """Get all settings in a category."""
-    if category not in ["api_keys", "scouts", "analyzers"]:
-        raise HTTPException(status_code=400, detail=f"Invalid category: {category}")
+    settings = _get_user_settings(db, current_user["id"]).get(category, {})
 
-    settings = db.get_settings_by_category(current_user["id"], category)
-
-    # Get schema
-    schemas = {
-        "api_keys": API_KEY_SETTINGS,
-        "scouts": SCOUT_SETTINGS,
-        "analyzers": ANALYZER_SETTINGS,
-    }
-    schema = schemas.get(category, {})
-
-    result = {}
-    for key, meta in schema.items():
-        setting = settings.get(key)
-        if setting:
-            value = setting["value"]
-            is_secret = setting["is_secret"]
-            display_value = mask_secret(value) if is_secret else value
-        else:
-            value = None
-            is_secret = category == "api_keys"
-            display_value = None
-
-        result[key] = {
-            "value": display_value,
-            "is_set": value is not None,
-            "is_secret": is_secret,
-            **meta,
-        }
-
-    return result
+    return Response(_category_settings_json(category, settings), media_type="application/json")
 
 
 @router.put("/{category}/{key}")
 async def update_setting(
-    category: str,
+    category: Category,
     key: str,
     update: SettingUpdate,
     current_user: dict = Depends(get_current_user),
     db: Database = Depends(get_db),
 ):
     """Update a setting value."""
-    if category not in ["api_keys", "scouts", "analyzers"]:
-        raise HTTPException(status_code=400, detail=f"Invalid category: {category}")
-
-    # Validate key exists in schema
-    schemas = {
-        "api_keys": API_KEY_SETTINGS,
-        "scouts": SCOUT_SETTINGS,
-        "analyzers": ANALYZER_SETTINGS,
-    }
-    if key not in schemas.get(category, {}):
+    if (category, key) not in _VALID_KEYS:
         raise HTTPException(status_code=400, detail=f"Invalid setting: {category}/{key}")
 
     # API keys are always secret
@@ -853,21 +1062,10 @@ async def update_setting(
         value=update.value,
         is_secret=is_secret,
     )
+    _invalidate_user_settings(current_user["id"])
 
-    meta = get_setting_metadata(category, key)
-    display_value = mask_secret(update.value) if is_secret else update.value
-
-    return {
-        "success": True,
-        "setting": {
-            "category": category,
-            "key": key,
-            "value": display_value,
-            "is_set": True,
-            "is_secret": is_secret,
-            **meta,
-        },
-    }
+    # The client refetches the category for the masked value and metadata
+    return {"success": True, "category": category, "key": key}
 
 
 @router.delete("/{category}/{key}")
@@ -879,6 +1077,7 @@ async def delete_setting(
 ):
     """Delete a setting."""
     deleted = db.delete_setting(current_user["id"], category, key)
+    _invalidate_user_settings(current_user["id"])
 
     if not deleted:
         raise HTTPException(status_code=404, detail="Setting not found")
@@ -894,6 +1093,7 @@ async def test_setting(
     db: Database = Depends(get_db),
 ):
     """Test a setting (e.g., validate an API key)."""
+    _check_test_rate_limit(current_user["id"], f"{category}/{key}")
     value = db.get_setting(current_user["id"], category, key)
 
     if not value:
@@ -902,34 +1102,16 @@ async def test_setting(
     # Test specific integrations
     if category == "api_keys":
         if key == "anthropic":
-            try:
-                import anthropic
-                client = anthropic.Anthropic(api_key=value)
-                # Make a minimal API call to verify
-                client.messages.create(
-                    model="claude-sonnet-4-20250514",
-                    max_tokens=10,
-                    messages=[{"role": "user", "content": "Hi"}],
-                )
-                return {"success": True, "message": "Anthropic API key is valid"}
-            except anthropic.AuthenticationError:
-                return {"success": False, "message": "Invalid API key"}
-            except Exception as e:
-                return {"success": False, "message": f"Error: {str(e)}"}
+            return await _test_anthropic(value)
 
         elif key == "openai":
-            try:
-                import openai
-                client = openai.OpenAI(api_key=value)
-                client.models.list()
-                return {"success": True, "message": "OpenAI API key is valid"}
-            except Exception as e:
-                return {"success": False, "message": f"Error: {str(e)}"}
+            return await _test_openai(value)
 
         elif key in ("producthunt_api_key", "producthunt_api_secret"):
             # Test Product Hunt credentials (need both key and secret)
-            api_key = db.get_setting(current_user["id"], "api_keys", "producthunt_api_key")
-            api_secret = db.get_setting(current_user["id"], "api_keys", "producthunt_api_secret")
+            api_keys = _get_api_keys(db, current_user["id"])
+            api_key = api_keys.get("producthunt_api_key")
+            api_secret = api_keys.get("producthunt_api_secret")
 
             if not api_key or not api_secret:
                 return {
@@ -937,23 +1119,6 @@ async def test_setting(
                     "message": "Both API Key and API Secret must be configured to test"
                 }
 
-            try:
-                import requests
-                response = requests.post(
-                    "https://api.producthunt.com/v2/oauth/token",
-                    json={
-                        "client_id": api_key,
-                        "client_secret": api_secret,
-                        "grant_type": "client_credentials",
-                    },
-                    timeout=10,
-                )
-                if response.status_code == 200 and response.json().get("access_token"):
-                    return {"success": True, "message": "Product Hunt credentials are valid"}
-                else:
-                    error = response.json().get("error", "Unknown error")
-                    return {"success": False, "message": f"Invalid credentials: {error}"}
-            except Exception as e:
-                return {"success": False, "message": f"Error: {str(e)}"}
+            return await _test_producthunt(api_key, api_secret)
 
     return {"success": True, "message": "Setting is configured"}
@@ -4,13 +4,22 @@ Stats Router
 Pipeline statistics and dashboard data.
 """
 
+from typing import Any
+
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 
-from web.api.deps import get_current_user, get_db
+from src.database import Database
+from web.api.cache import TTLCache
+from web.api.deps import get_current_user, run_with_db
 
 router = APIRouter()
 
+# Dashboard responses by endpoint and parameters. They are global (not
+# per-user) and polled by every open tab, so a few seconds of staleness
+# spares SQLite the repeated aggregate scans.
+_stats_cache: TTLCache[tuple, Any] = TTLCache(maxsize=32, ttl=10)
+
 
 class PipelineStats(BaseModel):
     """Pipeline statistics response."""
@@ -34,12 +43,18 @@ class ActivityItem(BaseModel):
 
 
 @router.get("/stats", response_model=PipelineStats)
-async def get_stats(current_user: dict = Depends(get_current_user)):
+async def get_stats(
+    current_user: dict = Depends(get_current_user),
+):
     """Get pipeline statistics for dashboard."""
-    db = get_db()
-    stats = db.get_pipeline_stats()
+    cached = _stats_cache.get(("stats",))
+    if cached is not None:
+        return cached
+
+    stats = await run_with_db(Database.get_pipeline_stats)
 
-    return PipelineStats(
+    # Counts come straight from SQL aggregates, so skip re-validation
+    result = PipelineStats.model_construct(
         inbox=stats["tools_by_status"]["inbox"],
         analyzing=stats["tools_by_status"]["analyzing"],
         review=stats["tools_by_status"]["review"],
@@ -50,12 +65,35 @@ async def get_stats(current_user: dict = Depends(get_current_user)):
         total_claims=stats["total_claims"],
         total_sources=stats["total_sources"],
     )
+    _stats_cache[("stats",)] = result
+    return result
+
+
+@router.get("/stats/cache")
+async def get_stats_cache_info(
+    current_user: dict = Depends(get_current_user),
+):
+    """Get hit/miss counters for the stats and activity response cache."""
+    return _stats_cache.cache_info()
 
 
 @router.get("/activity")
-async def get_activity(limit: int = 20, current_user: dict = Depends(get_current_user)):
+async def get_activity(
+    limit: int = 20,
+    current_user: dict = Depends(get_current_user),
+):
     """Get recent activity log."""
-    db = get_db()
+    cached = _stats_cache.get(("activity", limit))
+    if cached is not None:
+        return cached
+
+    result = {"activities": await run_with_db(_fetch_activity, limit)}
+    _stats_cache[("activity", limit)] = result
+    return result
+
+
+def _fetch_activity(db: Database, limit: int) -> list[dict]:
+    """Load recent changelog entries on a threadpool worker."""
     conn = db.connect()
 
     # Get recent changelog entries as activity
@@ -66,15 +104,14 @@ async def get_activity(limit: int = 20, current_user: dict = Depends(get_current
            ORDER BY c.detected_at DESC
            LIMIT ?""",
         (limit,)
-    ).fetchall()
+    )
 
-    activities = []
-    for row in rows:
-        activities.append({
+    return [
+        {
             "timestamp": row["detected_at"],
             "type": row["change_type"],
             "message": row["description"],
             "tool_name": row["tool_name"],
-        })
-
-    return {"activities": activities}
+        }
+        for row in rows
+    ]
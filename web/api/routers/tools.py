@@ -4,43 +4,25 @@ Tools Router
 CRUD operations for tools.
 """
 
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Optional
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
-from web.api.deps import get_current_user, get_db
+from src.database import Database
+from web.api.deps import get_current_user, get_db, run_with_db
+from web.api.responses import ORJSONResponse
+from web.api.routers.reports import invalidate_report_cache
 
 router = APIRouter()
 
+# Pipeline statuses in order (for error messages) and as a set for checks
+_STATUSES = ["inbox", "analyzing", "review", "approved", "rejected"]
+_VALID_STATUSES = frozenset(_STATUSES)
 
-class Tool(BaseModel):
-    """Tool response model."""
-    id: int
-    name: str
-    url: Optional[str]
-    description: Optional[str]
-    category: Optional[str]
-    status: str
-    relevance_score: Optional[float]
-    rejection_reason: Optional[str]
-    created_at: str
-    reviewed_at: Optional[str]
-
-
-class Claim(BaseModel):
-    """Claim response model."""
-    id: int
-    claim_type: Optional[str]
-    content: str
-    confidence: float
-    source_name: str
-    source_reliability: Optional[str]
-
-
-class ToolDetail(Tool):
-    """Tool with claims."""
-    claims: list[Claim]
+_VALID_SORT_FIELDS = frozenset({"relevance_score", "created_at", "name", "status", "category"})
 
 
 class StatusUpdate(BaseModel):
@@ -65,6 +47,92 @@ class ToolUpdate(BaseModel):
     relevance_score: Optional[float] = None
 
 
+def _fts_query(search: str) -> str:
+    """Turn free text into an FTS5 query matching every word as a prefix.
+
+    Each word is quoted so FTS5 syntax characters in user input are taken
+    literally instead of raising a query parse error.
+    """
+    return " ".join('"' + word.replace('"', '""') + '"*' for word in search.split())
+
+
+@lru_cache(maxsize=128)
+def _list_tools_sql(
+    n_statuses: int,
+    category: bool,
+    search: bool,
+    min_score: bool,
+    max_score: bool,
+    created_after: bool,
+    created_before: bool,
+    sort_by: str,
+    sort_direction: str,
+) -> tuple[str, str]:
+    """Build the page and count SQL for a combination of list filters.
+
+    The UI only uses a handful of combinations, so memoizing keeps the SQL
+    text identical between calls and sqlite3's statement cache can reuse
+    the prepared plan instead of re-parsing it.
+    """
+    where = " WHERE 1=1"
+    if n_statuses:
+        where += f" AND status IN ({','.join('?' * n_statuses)})"
+    if category:
+        where += " AND category = ?"
+    # Text search in name and description
+    if search:
+        where += " AND id IN (SELECT rowid FROM tools_fts WHERE tools_fts MATCH ?)"
+    # Score range filter
+    if min_score:
+        where += " AND relevance_score >= ?"
+    if max_score:
+        where += " AND relevance_score <= ?"
+    # Date range filter
+    if created_after:
+        where += " AND created_at >= ?"
+    if created_before:
+        where += " AND created_at <= ?"
+
+    # The window count is taken over the filtered rows before LIMIT applies,
+    # so the page and the total come back from one statement
+    query = "SELECT *, COUNT(*) OVER () AS _total FROM tools" + where
+
+    # Handle NULL values in sorting
+    if sort_by == "relevance_score":
+        query += f" ORDER BY {sort_by} {sort_direction} NULLS LAST, created_at DESC"
+    else:
+        query += f" ORDER BY {sort_by} {sort_direction}"
+
+    query += " LIMIT ? OFFSET ?"
+    return query, "SELECT COUNT(*) FROM tools" + where
+
+
+def _fetch_tools(
+    db: Database, query: str, count_query: str, params: list, limit: int, offset: int
+) -> tuple[list[dict], int]:
+    """Run a list page query and return its rows and the filtered total.
+
+    Runs on a threadpool worker with a pooled connection.
+    """
+    conn = db.connect()
+
+    # Plain tuples zipped with the column names once per query, instead of
+    # sqlite3.Row lookups per row. _total is the last column, so zip drops it
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    cursor.execute(query, [*params, limit, offset])
+    columns = [column[0] for column in cursor.description][:-1]
+    tools = []
+    total = 0
+    for row in cursor:
+        tools.append(dict(zip(columns, row)))
+        total = row[-1]
+    if not tools and offset:
+        # Paged past the end: no row to carry the count
+        total = conn.execute(count_query, params).fetchone()[0]
+    return tools, total
+
+
 @router.get("")
 async def list_tools(
     status: Optional[str] = Query(None, description="Filter by status (comma-separated for multiple)"),
@@ -81,81 +149,41 @@ async def list_tools(
     current_user: dict = Depends(get_current_user),
 ):
     """List tools with advanced filters and search."""
-    db = get_db()
-    conn = db.connect()
+    # Sorting
+    if sort_by not in _VALID_SORT_FIELDS:
+        sort_by = "relevance_score"
 
-    # Build query
-    query = "SELECT * FROM tools WHERE 1=1"
-    params: list = []
-    count_params: list = []
+    sort_direction = "ASC" if sort_order.lower() == "asc" else "DESC"
 
     # Status filter (supports multiple comma-separated values)
-    if status:
-        statuses = [s.strip() for s in status.split(",")]
-        placeholders = ",".join("?" * len(statuses))
-        query += f" AND status IN ({placeholders})"
-        params.extend(statuses)
-        count_params.extend(statuses)
-
-    # Category filter
+    statuses = [s.strip() for s in status.split(",")] if status else []
+    params: list = list(statuses)
     if category:
-        query += " AND category = ?"
         params.append(category)
-        count_params.append(category)
-
-    # Text search in name and description
-    if search:
-        search_term = f"%{search}%"
-        query += " AND (name LIKE ? OR description LIKE ?)"
-        params.extend([search_term, search_term])
-        count_params.extend([search_term, search_term])
-
-    # Score range filter
+    search_query = _fts_query(search) if search else ""
+    if search_query:
+        params.append(search_query)
     if min_score is not None:
-        query += " AND relevance_score >= ?"
         params.append(min_score)
-        count_params.append(min_score)
-
     if max_score is not None:
-        query += " AND relevance_score <= ?"
         params.append(max_score)
-        count_params.append(max_score)
-
-    # Date range filter
     if created_after:
-        query += " AND created_at >= ?"
         params.append(created_after)
-        count_params.append(created_after)
-
     if created_before:
-        query += " AND created_at <= ?"
         params.append(created_before)
-        count_params.append(created_before)
 
-    # Get total count before pagination
-    count_query = query.replace("SELECT *", "SELECT COUNT(*)")
-    total = conn.execute(count_query, count_params).fetchone()[0]
+    query, count_query = _list_tools_sql(
+        len(statuses), bool(category), bool(search_query), min_score is not None,
+        max_score is not None, bool(created_after), bool(created_before),
+        sort_by, sort_direction,
+    )
 
-    # Sorting
-    valid_sort_fields = ["relevance_score", "created_at", "name", "status", "category"]
-    if sort_by not in valid_sort_fields:
-        sort_by = "relevance_score"
+    tools, total = await run_with_db(
+        _fetch_tools, query, count_query, params, limit, offset
+    )
 
-    sort_direction = "ASC" if sort_order.lower() == "asc" else "DESC"
-
-    # Handle NULL values in sorting
-    if sort_by == "relevance_score":
-        query += f" ORDER BY {sort_by} {sort_direction} NULLS LAST, created_at DESC"
-    else:
-        query += f" ORDER BY {sort_by} {sort_direction}"
-
-    query += " LIMIT ? OFFSET ?"
-    params.extend([limit, offset])
-
-    rows = conn.execute(query, params).fetchall()
-    tools = [dict(row) for row in rows]
-
-    return {
+    # Rows hold only JSON-native values; skip FastAPI's jsonable_encoder pass
+    return ORJSONResponse({
         "tools": tools,
         "total": total,
         "limit": limit,
@@ -171,37 +199,126 @@ async def list_tools(
             "sort_by": sort_by,
             "sort_order": sort_order,
         },
+    })
+
+
+# Fixed paths are registered before the /{tool_id} routes that would
+# otherwise capture "bulk" as a tool ID
+@router.put("/bulk/status")
+async def bulk_update_status(
+    update: BulkStatusUpdate,
+    current_user: dict = Depends(get_current_user),
+    db: Database = Depends(get_db),
+):
+    """Bulk update status for multiple tools."""
+
+    if update.status not in _VALID_STATUSES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid status. Must be one of: {_STATUSES}"
+        )
+
+    if not update.tool_ids:
+        raise HTTPException(status_code=400, detail="No tool IDs provided")
+
+    if len(update.tool_ids) > 100:
+        raise HTTPException(status_code=400, detail="Maximum 100 tools per bulk operation")
+
+    # Log to changelog for approval, in the same transaction as the update
+    names = db.update_tools_status(
+        update.tool_ids,
+        update.status,
+        update.rejection_reason,
+        changelog="Tool approved: {name}" if update.status == "approved" else None,
+    )
+    updated = [tool_id for tool_id in update.tool_ids if tool_id in names]
+    not_found = [tool_id for tool_id in update.tool_ids if tool_id not in names]
+
+    invalidate_report_cache()
+
+    return {
+        "success": True,
+        "status": update.status,
+        "updated": updated,
+        "updated_count": len(updated),
+        "not_found": not_found,
     }
 
 
-@router.get("/{tool_id}")
-async def get_tool(tool_id: int, current_user: dict = Depends(get_current_user)):
-    """Get tool details with claims and related data."""
-    db = get_db()
+@router.delete("/bulk")
+async def bulk_delete_tools(
+    tool_ids: list[int],
+    current_user: dict = Depends(get_current_user),
+    db: Database = Depends(get_db),
+):
+    """Bulk delete tools."""
+    if not tool_ids:
+        raise HTTPException(status_code=400, detail="No tool IDs provided")
+
+    if len(tool_ids) > 100:
+        raise HTTPException(status_code=400, detail="Maximum 100 tools per bulk operation")
+
+    # Existence is read back from the DELETE itself rather than looked up first
+    existing = db.delete_tools(tool_ids)
+    deleted = [tool_id for tool_id in tool_ids if tool_id in existing]
+    not_found = [tool_id for tool_id in tool_ids if tool_id not in existing]
+    invalidate_report_cache()
+
+    return {
+        "success": True,
+        "deleted": deleted,
+        "deleted_count": len(deleted),
+        "not_found": not_found,
+    }
+
+
+def _fetch_tool_detail(db: Database, tool_id: int) -> Optional[dict]:
+    """Load a tool with its claims, changelog and discoveries.
+
+    Runs on a threadpool worker with a pooled connection.
+    """
     conn = db.connect()
-    tool = db.get_tool(tool_id)
 
-    if not tool:
-        raise HTTPException(status_code=404, detail="Tool not found")
+    # The tool row and its claims (highest confidence first) in one statement
+    row = conn.execute(
+        """SELECT t.*, (
+               SELECT json_group_array(json_object(
+                   'id', c.id, 'tool_id', c.tool_id, 'source_id', c.source_id,
+                   'claim_type', c.claim_type, 'content', c.content,
+                   'confidence', c.confidence, 'verified', c.verified,
+                   'conflicting', c.conflicting, 'raw_text', c.raw_text,
+                   'created_at', c.created_at, 'source_name', c.source_name,
+                   'source_reliability', c.source_reliability
+               ))
+               FROM (SELECT c.*, s.name AS source_name, s.reliability AS source_reliability
+                     FROM claims c
+                     JOIN sources s ON c.source_id = s.id
+                     WHERE c.tool_id = t.id
+                     ORDER BY c.confidence DESC) c
+           ) AS claims_json
+           FROM tools t WHERE t.id = ?""",
+        [tool_id]
+    ).fetchone()
+    if row is None:
+        return None
 
-    claims = db.get_claims_for_tool(tool_id)
+    tool = dict(row)
+    claims = orjson.loads(tool.pop("claims_json"))
 
     # Get changelog entries for this tool
     changelog = conn.execute(
         "SELECT * FROM changelog WHERE tool_id = ? ORDER BY detected_at DESC LIMIT 50",
         [tool_id]
-    ).fetchall()
+    )
 
-    # Get discoveries that mentioned this tool
+    # Get discoveries the analyzer linked to this tool
     discoveries = conn.execute(
-        """SELECT d.* FROM discoveries d
-           JOIN claims c ON d.id = c.discovery_id
-           WHERE c.tool_id = ?
-           GROUP BY d.id
-           ORDER BY d.discovered_at DESC LIMIT 20""",
+        """SELECT * FROM discoveries WHERE tool_id = ?
+           ORDER BY created_at DESC LIMIT 20""",
         [tool_id]
-    ).fetchall()
+    )
 
+    # Build dicts straight off the cursors rather than via fetchall() lists
     return {
         **tool,
         "claims": claims,
@@ -210,205 +327,113 @@ async def get_tool(tool_id: int, current_user: dict = Depends(get_current_user))
     }
 
 
-@router.put("/{tool_id}")
-async def update_tool(
+@router.get("/{tool_id}")
+async def get_tool(
     tool_id: int,
-    update: ToolUpdate,
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
 ):
-    """Update tool details."""
-    db = get_db()
-    conn = db.connect()
+    """Get tool details with claims and related data."""
+    tool = await run_with_db(_fetch_tool_detail, tool_id)
 
-    tool = db.get_tool(tool_id)
     if not tool:
         raise HTTPException(status_code=404, detail="Tool not found")
 
-    # Build update query dynamically
-    updates: list[str] = []
-    params: list[Any] = []
+    return ORJSONResponse(tool)
 
-    if update.name is not None:
-        updates.append("name = ?")
-        params.append(update.name)
 
-    if update.url is not None:
-        updates.append("url = ?")
-        params.append(update.url)
+@lru_cache(maxsize=32)
+def _update_tool_sql(fields: tuple[str, ...]) -> str:
+    """Build the UPDATE statement for a combination of changed fields."""
+    assignments = ", ".join(f"{field} = ?" for field in fields)
+    return f"UPDATE tools SET {assignments} WHERE id = ? RETURNING *"
 
-    if update.description is not None:
-        updates.append("description = ?")
-        params.append(update.description)
 
-    if update.category is not None:
-        updates.append("category = ?")
-        params.append(update.category)
-
-    if update.relevance_score is not None:
-        updates.append("relevance_score = ?")
-        params.append(update.relevance_score)
+@router.put("/{tool_id}")
+async def update_tool(
+    tool_id: int,
+    update: ToolUpdate,
+    current_user: dict = Depends(get_current_user),
+    db: Database = Depends(get_db),
+):
+    """Update tool details."""
+    conn = db.connect()
 
-    if not updates:
+    # Fields are dumped in model order, so each combination of changed
+    # fields maps to one cached statement
+    changes = update.model_dump(exclude_none=True)
+    if not changes:
         raise HTTPException(status_code=400, detail="No fields to update")
 
-    params.append(tool_id)
-    query = f"UPDATE tools SET {', '.join(updates)} WHERE id = ?"
-    conn.execute(query, params)
+    query = _update_tool_sql(tuple(changes))
+    params = [*changes.values(), tool_id]
+    row = conn.execute(query, params).fetchone()
     conn.commit()
 
-    # Get updated tool
-    updated_tool = db.get_tool(tool_id)
+    if row is None:
+        raise HTTPException(status_code=404, detail="Tool not found")
+
+    invalidate_report_cache()
 
     return {
         "success": True,
-        "tool": updated_tool,
+        "tool": dict(row),
     }
 
 
 @router.delete("/{tool_id}")
-async def delete_tool(tool_id: int, current_user: dict = Depends(get_current_user)):
+async def delete_tool(
+    tool_id: int,
+    current_user: dict = Depends(get_current_user),
+    db: Database = Depends(get_db),
+):
     """Delete a tool and its associated data."""
-    db = get_db()
-    conn = db.connect()
-
-    tool = db.get_tool(tool_id)
-    if not tool:
+    # Claims are deleted with the tool; changelog entries cascade
+    if not db.delete_tools([tool_id]):
         raise HTTPException(status_code=404, detail="Tool not found")
 
-    # Delete associated data
-    conn.execute("DELETE FROM claims WHERE tool_id = ?", [tool_id])
-    conn.execute("DELETE FROM changelog WHERE tool_id = ?", [tool_id])
-    conn.execute("DELETE FROM tools WHERE id = ?", [tool_id])
-    conn.commit()
+    invalidate_report_cache()
 
     return {"success": True, "deleted_tool_id": tool_id}
 
 
 @router.put("/{tool_id}/status")
-async def update_tool_status(tool_id: int, update: StatusUpdate, current_user: dict = Depends(get_current_user)):
+async def update_tool_status(
+    tool_id: int,
+    update: StatusUpdate,
+    current_user: dict = Depends(get_current_user),
+    db: Database = Depends(get_db),
+):
     """Update tool status (approve/reject)."""
-    db = get_db()
-    tool = db.get_tool(tool_id)
-
-    if not tool:
+    if update.status not in _VALID_STATUSES:
+        raise HTTPException(status_code=400, detail=f"Invalid status. Must be one of: {_STATUSES}")
+
+    # Log to changelog for approval, in the same transaction as the update
+    updated = db.update_tools_status(
+        [tool_id],
+        update.status,
+        update.rejection_reason,
+        changelog="Tool approved: {name}" if update.status == "approved" else None,
+    )
+
+    if not updated:
         raise HTTPException(status_code=404, detail="Tool not found")
 
-    valid_statuses = ["inbox", "analyzing", "review", "approved", "rejected"]
-    if update.status not in valid_statuses:
-        raise HTTPException(status_code=400, detail=f"Invalid status. Must be one of: {valid_statuses}")
-
-    db.update_tool_status(tool_id, update.status, update.rejection_reason)
-
-    # Log to changelog for approval
-    if update.status == "approved":
-        db.add_changelog_entry(
-            tool_id,
-            "new",
-            f"Tool approved: {tool['name']}"
-        )
+    invalidate_report_cache()
 
     return {"success": True, "tool_id": tool_id, "status": update.status}
 
 
 @router.get("/{tool_id}/claims")
-async def get_tool_claims(tool_id: int, current_user: dict = Depends(get_current_user)):
+async def get_tool_claims(
+    tool_id: int,
+    current_user: dict = Depends(get_current_user),
+    db: Database = Depends(get_db),
+):
     """Get claims for a specific tool."""
-    db = get_db()
-    tool = db.get_tool(tool_id)
+    claims = db.get_claims_for_tool(tool_id)
 
-    if not tool:
+    # Only a tool without claims needs the existence check
+    if not claims and db.get_tool(tool_id) is None:
         raise HTTPException(status_code=404, detail="Tool not found")
 
-    claims = db.get_claims_for_tool(tool_id)
-
     return {"claims": claims}
-
-
-@router.put("/bulk/status")
-async def bulk_update_status(
-    update: BulkStatusUpdate,
-    current_user: dict = Depends(get_current_user)
-):
-    """Bulk update status for multiple tools."""
-    db = get_db()
-
-    valid_statuses = ["inbox", "analyzing", "review", "approved", "rejected"]
-    if update.status not in valid_statuses:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid status. Must be one of: {valid_statuses}"
-        )
-
-    if not update.tool_ids:
-        raise HTTPException(status_code=400, detail="No tool IDs provided")
-
-    if len(update.tool_ids) > 100:
-        raise HTTPException(status_code=400, detail="Maximum 100 tools per bulk operation")
-
-    updated = []
-    not_found = []
-
-    for tool_id in update.tool_ids:
-        tool = db.get_tool(tool_id)
-        if not tool:
-            not_found.append(tool_id)
-            continue
-
-        db.update_tool_status(tool_id, update.status, update.rejection_reason)
-        updated.append(tool_id)
-
-        # Log to changelog for approval
-        if update.status == "approved":
-            db.add_changelog_entry(
-                tool_id,
-                "new",
-                f"Tool approved: {tool['name']}"
-            )
-
-    return {
-        "success": True,
-        "status": update.status,
-        "updated": updated,
-        "updated_count": len(updated),
-        "not_found": not_found,
-    }
-
-
-@router.delete("/bulk")
-async def bulk_delete_tools(
-    tool_ids: list[int],
-    current_user: dict = Depends(get_current_user)
-):
-    """Bulk delete tools."""
-    db = get_db()
-    conn = db.connect()
-
-    if not tool_ids:
-        raise HTTPException(status_code=400, detail="No tool IDs provided")
-
-    if len(tool_ids) > 100:
-        raise HTTPException(status_code=400, detail="Maximum 100 tools per bulk operation")
-
-    deleted = []
-    not_found = []
-
-    for tool_id in tool_ids:
-        tool = db.get_tool(tool_id)
-        if not tool:
-            not_found.append(tool_id)
-            continue
-
-        # Delete associated claims first
-        conn.execute("DELETE FROM claims WHERE tool_id = ?", [tool_id])
-        # Delete the tool
-        conn.execute("DELETE FROM tools WHERE id = ?", [tool_id])
-        deleted.append(tool_id)
-
-    conn.commit()
-
-    return {
-        "success": True,
-        "deleted": deleted,
-        "deleted_count": len(deleted),
-        "not_found": not_found,
-    }
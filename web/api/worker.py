@@ -0,0 +1,70 @@
+"""
+Job Worker
+
+Dedicated worker pools that run background jobs off the event loop.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+# Worker threads per queue. Each job type gets its own pool so a slow
+# scout crawl cannot hold up analyzer or curation jobs.
+QUEUES = {
+    "scout": 2,
+    "analyze": 1,
+    "curate": 1,
+    "update": 1,
+}
+
+_executors: dict[str, ThreadPoolExecutor] = {}
+_futures: dict[str, Future] = {}
+_lock = threading.Lock()
+
+
+def _get_executor(queue: str) -> ThreadPoolExecutor:
+    """Get (or lazily start) the pool for a queue."""
+    if queue not in QUEUES:
+        raise ValueError(f"Unknown job queue: {queue}")
+    with _lock:
+        executor = _executors.get(queue)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=QUEUES[queue],
+                thread_name_prefix=f"glean-{queue}",
+            )
+            _executors[queue] = executor
+        return executor
+
+
+def submit(queue: str, job_id: str, fn: Callable[..., Any], *args: Any) -> Future:
+    """Queue a job function on the given worker pool."""
+    future = _get_executor(queue).submit(fn, *args)
+    with _lock:
+        _futures[job_id] = future
+    future.add_done_callback(lambda _: _forget(job_id))
+    return future
+
+
+def _forget(job_id: str) -> None:
+    with _lock:
+        _futures.pop(job_id, None)
+
+
+def cancel(job_id: str) -> bool:
+    """Cancel a job that is still waiting in its queue.
+
+    Returns True if the job was dequeued before it started running.
+    """
+    with _lock:
+        future = _futures.get(job_id)
+    return future.cancel() if future else False
+
+
+def shutdown() -> None:
+    """Stop all worker pools, dropping jobs that have not started yet."""
+    with _lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=False, cancel_futures=True)